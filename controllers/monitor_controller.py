@@ -2,16 +2,29 @@
 Monitor Controller
 Handles business logic for the railway monitor
 """
-import json
-from datetime import datetime
+import time
 from typing import Callable, Optional
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, Signal, QThread, QMetaObject, Qt, Q_RETURN_ARG
 
 from core.railway_system import RailwaySystem
-from core.json_formatter import RailwayJSONFormatter
+from core.json_formatter import RailwayJSONFormatter, parse_json_file
 from core.tcp_server import RailwayTCPServer, BlockStatus
 
 
+# Color names accepted in BLOCK_ID:COLOR packets
+_COLOR_MAP = {
+    'red': '#FF0000',
+    'green': '#00FF00',
+    'blue': '#0000FF',
+    'yellow': '#FFFF00',
+    'orange': '#FFA500',
+    'purple': '#800080',
+    'gray': '#888888',
+    'black': '#000000',
+    'white': '#FFFFFF'
+}
+
+
 class MonitorController(QObject):
     """Controller for monitor operations - handles all business logic"""
     
@@ -27,12 +40,20 @@ class MonitorController(QObject):
         self.railway_system = railway_system
         self.formatter = RailwayJSONFormatter(railway_system)
         self.tcp_server: Optional[RailwayTCPServer] = None
+        self._net_thread: Optional[QThread] = None
+        self._block_id_index: dict[str, str] = {}  # BL ID -> rail_id
+        self._ts_second = -1  # Wall-clock second the cached timestamp belongs to
+        self._ts_str = ""
         self.is_listening = False
         
     def log(self, message: str):
         """Log a message"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_message.emit(f"[{timestamp}] {message}")
+        # Format the timestamp at most once per second during message bursts
+        now = int(time.time())
+        if now != self._ts_second:
+            self._ts_second = now
+            self._ts_str = time.strftime("%H:%M:%S", time.localtime(now))
+        self.log_message.emit(f"[{self._ts_str}] {message}")
     
     def load_layout(self, file_path: str) -> tuple[bool, str, int]:
         """
@@ -40,8 +61,8 @@ class MonitorController(QObject):
         Returns: (success, message, block_count)
         """
         try:
-            with open(file_path, 'r') as f:
-                data = json.load(f)
+            with open(file_path, 'rb') as f:
+                data = parse_json_file(f)
                 
                 # Check if it's the new blockGroups format or old format
                 if "blockGroups" in data:
@@ -51,6 +72,7 @@ class MonitorController(QObject):
                     # Old format (backward compatibility)
                     self.railway_system.load_from_json(data)
                 
+                self._rebuild_block_id_index()
                 block_count = len(self.railway_system.blocks)
                 self.log(f"✓ Loaded layout with {block_count} blocks")
                 
@@ -85,24 +107,10 @@ class MonitorController(QObject):
         Returns: success
         """
         # Color name mapping
-        color_map = {
-            'red': '#FF0000',
-            'green': '#00FF00',
-            'blue': '#0000FF',
-            'yellow': '#FFFF00',
-            'orange': '#FFA500',
-            'purple': '#800080',
-            'gray': '#888888',
-            'black': '#000000',
-            'white': '#FFFFFF'
-        }
-        
-        if color.lower() in color_map:
-            color = color_map[color.lower()]
+        color = _COLOR_MAP.get(color.lower(), color)
         
-        # Update block color
-        if block_id in self.railway_system.blocks:
-            self.railway_system.set_block_color(block_id, color)
+        # Update block color (one lookup; the model reports unknown blocks)
+        if self.railway_system.set_block_color(block_id, color):
             self.log(f"✓ Updated {block_id} → {color}")
             return True
         else:
@@ -125,10 +133,9 @@ class MonitorController(QObject):
         Reset all block colors to default
         Returns: number of blocks reset
         """
-        count = 0
-        for block_id in self.railway_system.blocks:
-            self.railway_system.set_block_color(block_id, '#888888')
-            count += 1
+        colors = {block_id: '#888888' for block_id in self.railway_system.blocks}
+        self.railway_system.set_block_colors(colors)
+        count = len(colors)
         self.log(f"↻ Reset {count} blocks to default color")
         return count
     
@@ -143,7 +150,7 @@ class MonitorController(QObject):
     # TCP Server Management
     # ----------------------
     
-    def start_tcp_server(self, port: int, host: str = "0.0.0.0") -> bool:
+    def start_tcp_server(self, port: int, host: str = "0.0.0.0", nodelay: bool = True) -> bool:
         """
         Start the TCP server
         Returns: success
@@ -153,9 +160,15 @@ class MonitorController(QObject):
             return False
         
         # Create and configure TCP server
-        self.tcp_server = RailwayTCPServer(port=port, host=host)
+        self.tcp_server = RailwayTCPServer(port=port, host=host, nodelay=nodelay)
         
-        # Connect TCP server signals to controller methods
+        # Run socket I/O and message parsing off the GUI thread
+        self._net_thread = QThread()
+        self.tcp_server.moveToThread(self._net_thread)
+        self._net_thread.finished.connect(self.tcp_server.deleteLater)
+        self._net_thread.start()
+        
+        # Connect TCP server signals to controller methods (queued across threads)
         self.tcp_server.log_message.connect(self.log)
         self.tcp_server.error_occurred.connect(self._on_tcp_error)
         self.tcp_server.client_connected.connect(self._on_client_connected)
@@ -163,15 +176,17 @@ class MonitorController(QObject):
         self.tcp_server.block_status_update.connect(self._on_block_status_update)
         self.tcp_server.batch_status_update.connect(self._on_batch_status_update)
         
-        # Start server
-        if self.tcp_server.start():
+        # Start server on its own thread and wait for the listen result
+        started = QMetaObject.invokeMethod(self.tcp_server, "start",
+                                           Qt.BlockingQueuedConnection, Q_RETURN_ARG(bool))
+        if started:
             self.is_listening = True
             self.log(f"🟢 TCP Server started on {host}:{port}")
             self.log(f"📡 Accepting connections from any IP address")
             self.tcp_server_started.emit(port)
             return True
         else:
-            self.tcp_server = None
+            self._stop_net_thread()
             self.log(f"❌ Failed to start TCP server on port {port}")
             self.tcp_server_error.emit(f"Failed to start server on port {port}")
             return False
@@ -182,14 +197,21 @@ class MonitorController(QObject):
             return
         
         if self.tcp_server:
-            self.tcp_server.stop()
-            self.tcp_server = None
+            QMetaObject.invokeMethod(self.tcp_server, "stop", Qt.BlockingQueuedConnection)
+            self._stop_net_thread()
         
         self.is_listening = False
         self.log("🔴 TCP Server stopped")
         self.tcp_server_stopped.emit()
         self.client_count_changed.emit(0)
     
+    def _stop_net_thread(self):
+        """Shut down the network thread and drop the server"""
+        self._net_thread.quit()
+        self._net_thread.wait()
+        self.tcp_server = None
+        self._net_thread = None
+    
     def get_connected_client_count(self) -> int:
         """Get number of connected clients"""
         if self.tcp_server:
@@ -219,38 +241,57 @@ class MonitorController(QObject):
         color = BlockStatus.get_color(status)
         
         # Update block color in railway system
-        if block_id in self.railway_system.blocks:
-            self.railway_system.set_block_color(block_id, color)
+        rail_id = self._resolve_rail_id(block_id)
+        if rail_id is not None:
+            self.railway_system.set_block_color(rail_id, color)
+        self._log_status_update(block_id, rail_id, status, color)
+    
+    def _log_status_update(self, block_id: str, rail_id: Optional[str], status: str, color: str):
+        """Log the outcome of one status update"""
+        if rail_id is None:
+            self.log(f"⚠️ Block not found: {block_id}")
+        elif rail_id == block_id:
             self.log(f"✓ {block_id} → {status} ({color})")
         else:
-            # Try to find by block_id (BL001001) instead of rail_id
-            found = False
-            for rail_id, block in self.railway_system.blocks.items():
-                if hasattr(block, 'block_id') and block.block_id == block_id:
-                    self.railway_system.set_block_color(rail_id, color)
-                    self.log(f"✓ {block_id} (rail {rail_id}) → {status} ({color})")
-                    found = True
-                    break
-            
-            if not found:
-                self.log(f"⚠️ Block not found: {block_id}")
+            self.log(f"✓ {block_id} (rail {rail_id}) → {status} ({color})")
+    
+    def _resolve_rail_id(self, block_id: str) -> Optional[str]:
+        """Map a rail id or BL ID (e.g. BL001001) to a rail id, or None if unknown"""
+        blocks = self.railway_system.blocks
+        if block_id in blocks:
+            return block_id
+        
+        # BL IDs are reassigned on save/load, so rebuild the index on a stale hit
+        rail_id = self._block_id_index.get(block_id)
+        block = blocks.get(rail_id)
+        if block is None or block.block_id != block_id:
+            self._rebuild_block_id_index()
+            rail_id = self._block_id_index.get(block_id)
+        return rail_id
+    
+    def _rebuild_block_id_index(self):
+        """Rebuild the BL ID -> rail_id lookup from the railway system"""
+        self._block_id_index = {
+            block.block_id: rail_id
+            for rail_id, block in self.railway_system.blocks.items()
+            if block.block_id
+        }
     
     def _on_batch_status_update(self, updates: list):
         """Handle batch status updates from TCP server"""
-        success_count = 0
+        # Resolve every id up front, logging each update as the single path does;
+        # several status lines from one read arrive here as a batch
+        colors = {}
         for block_id, status in updates:
+            rail_id = self._resolve_rail_id(block_id)
             color = BlockStatus.get_color(status)
-            
-            if block_id in self.railway_system.blocks:
-                self.railway_system.set_block_color(block_id, color)
-                success_count += 1
-            else:
-                # Try to find by block_id (BL001001)
-                for rail_id, block in self.railway_system.blocks.items():
-                    if hasattr(block, 'block_id') and block.block_id == block_id:
-                        self.railway_system.set_block_color(rail_id, color)
-                        success_count += 1
-                        break
+            if rail_id is not None:
+                colors[rail_id] = color
+            self._log_status_update(block_id, rail_id, status, color)
+        
+        # Apply the whole batch with a single model notification
+        self.railway_system.set_block_colors(colors)
+        success_count = len(colors)
         
         self.log(f"✓ Batch update: {success_count}/{len(updates)} blocks updated")
 
@@ -90,7 +90,7 @@ class SettingsController(QObject):
     
     def apply_settings(self, new_settings: Dict[str, Any]) -> Tuple[bool, str]:
         """
-        Validate and apply settings
+        Validate and apply settings (all of them, or just the changed ones)
         Returns: (success, message)
         """
         # Validate TCP port
@@ -105,8 +105,11 @@ class SettingsController(QObject):
             if addr != '0.0.0.0' and not self.validate_ip(addr):
                 return False, "Invalid TCP bind address format"
         
-        # Save settings
-        return self.save_settings(new_settings)
+        # Merge into the in-memory settings; only touch the file if something changed
+        settings = {**self.settings, **new_settings}
+        if settings == self.settings:
+            return True, "Settings are already up to date."
+        return self.save_settings(settings)
     
     def reset_to_defaults(self) -> Dict[str, Any]:
         """
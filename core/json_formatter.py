@@ -4,14 +4,38 @@ JSON Formatter - Converts railway system to/from blockGroups format
 
 from typing import Dict, List, Set
 from datetime import datetime
+import json
+import mmap
+import os
 from core.railway_system import RailwaySystem, RailBlock
 
+try:
+    import orjson  # Optional: faster JSON for large layouts
+except ImportError:
+    orjson = None
+
+
+def parse_json_file(f):
+    """Parse an open binary file through a read-only memory map"""
+    size = os.fstat(f.fileno()).st_size
+    if size == 0:
+        raise ValueError("File is empty")
+    with mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ) as mm:
+        if orjson is not None:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+        return json.loads(mm[:])
+
 
 class RailwayJSONFormatter:
     """Handles conversion to/from blockGroups JSON format"""
     
     def __init__(self, railway_system: RailwaySystem):
         self.railway_system = railway_system
+        self._reset_counters()
+        
+    def _reset_counters(self):
+        """Restart ID numbering so every export produces the same IDs"""
         self.block_counter = 1
         self.group_counter = 1
         self.ac_counter = 1
@@ -19,6 +43,8 @@ class RailwayJSONFormatter:
         
     def to_blockgroups_json(self) -> dict:
         """Export to blockGroups JSON format with axle counters and signals"""
+        self._reset_counters()
+        
         # First, auto-create groups based on current connections
         self.railway_system.auto_create_groups()
             
@@ -146,6 +172,9 @@ class RailwayJSONFormatter:
         # Store legacy data for connection restoration
         legacy_data = self.railway_system.to_json()
         
+        # Every rail now carries a new BL ID; views repaint the labels showing them
+        self.railway_system.block_ids_changed.emit()
+        
         return {
             "blockGroups": block_groups,
             "turnouts": {
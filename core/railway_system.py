@@ -138,7 +138,9 @@ class RailwaySystem(QObject):
     block_removed = Signal(str)  # block_id
     block_updated = Signal(str)  # block_id
     block_color_changed = Signal(str, str)  # block_id, new_color
+    block_colors_changed = Signal(dict)  # {block_id: new_color}
     system_cleared = Signal()
+    block_ids_changed = Signal()  # BL IDs were reassigned or cleared
     group_created = Signal(str)  # group_id
     group_updated = Signal(str)  # group_id
     
@@ -148,6 +150,13 @@ class RailwaySystem(QObject):
         self.groups: Dict[str, RailGroup] = {}
         self._next_id = 1
         self._next_group_id = 1
+        # Bumped on every structural change so views can skip redundant refreshes
+        self._system_version = 0
+        
+    @property
+    def version(self) -> int:
+        """Counter that changes whenever blocks, connections or groups change"""
+        return self._system_version
         
     def generate_id(self) -> str:
         """Generate a unique ID for a new block"""
@@ -161,6 +170,7 @@ class RailwaySystem(QObject):
         block_id = self.generate_id()
         block = RailBlock(block_id, rail_type, x, y, rotation, length)
         self.blocks[block_id] = block
+        self._system_version += 1
         self.block_added.emit(block_id)
         return block_id
         
@@ -170,6 +180,7 @@ class RailwaySystem(QObject):
             # Remove all connections to this block
             self._remove_connections_to_block(block_id)
             del self.blocks[block_id]
+            self._system_version += 1
             self.block_removed.emit(block_id)
             
     def update_block_position(self, block_id: str, x: float, y: float):
@@ -177,12 +188,14 @@ class RailwaySystem(QObject):
         if block_id in self.blocks:
             self.blocks[block_id].x = x
             self.blocks[block_id].y = y
+            self._system_version += 1
             self.block_updated.emit(block_id)
             
     def update_block_rotation(self, block_id: str, rotation: float):
         """Update block rotation"""
         if block_id in self.blocks:
             self.blocks[block_id].rotation = rotation
+            self._system_version += 1
             self.block_updated.emit(block_id)
             
     def connect_blocks(self, block_id1: str, point1: str, 
@@ -252,6 +265,7 @@ class RailwaySystem(QObject):
         
         # Verify the connection was set up correctly (immediate validation)
         self._verify_connection_consistency(block_id1, block_id2)
+        self._system_version += 1
         
         self.block_updated.emit(block_id1)
         self.block_updated.emit(block_id2)
@@ -314,6 +328,7 @@ class RailwaySystem(QObject):
             
             # Remove both sides of connection
             block.connections[point] = None
+            self._system_version += 1
             if conn_id in self.blocks:
                 self.blocks[conn_id].connections[conn_point] = None
                 self.block_updated.emit(conn_id)
@@ -335,11 +350,28 @@ class RailwaySystem(QObject):
                     self.blocks[conn_id].connections[conn_point] = None
                     self.block_updated.emit(conn_id)
                     
-    def set_block_color(self, block_id: str, color: str):
-        """Set the color of a block (for monitoring/train position)"""
-        if block_id in self.blocks:
-            self.blocks[block_id].color = color
+    def set_block_color(self, block_id: str, color: str) -> bool:
+        """Set the color of a block (for monitoring/train position); returns False if unknown"""
+        block = self.blocks.get(block_id)
+        if block is None:
+            return False
+        # Repeated status broadcasts often resend the current color; don't repaint for those
+        if block.color != color:
+            block.color = color
             self.block_color_changed.emit(block_id, color)
+        return True
+            
+    def set_block_colors(self, colors: dict):
+        """Set the colors of several blocks and notify listeners once"""
+        applied = {}
+        blocks = self.blocks
+        for block_id, color in colors.items():
+            block = blocks.get(block_id)
+            if block is not None and block.color != color:
+                block.color = color
+                applied[block_id] = color
+        if applied:
+            self.block_colors_changed.emit(applied)
             
     def create_group(self, name: str = "") -> str:
         """Create a new rail group"""
@@ -348,6 +380,7 @@ class RailwaySystem(QObject):
         
         group = RailGroup(group_id, name)
         self.groups[group_id] = group
+        self._system_version += 1
         self.group_created.emit(group_id)
         return group_id
         
@@ -364,6 +397,7 @@ class RailwaySystem(QObject):
             self.blocks[rail_id].group_id = group_id
             if rail_id not in self.groups[group_id].rail_ids:
                 self.groups[group_id].rail_ids.append(rail_id)
+            self._system_version += 1
             self.group_updated.emit(group_id)
             self.block_updated.emit(rail_id)
             
@@ -454,6 +488,7 @@ class RailwaySystem(QObject):
                 block.group_id = None
                 block.block_id = None  # Clear block IDs from failed attempt
             self.groups.clear()
+            self.block_ids_changed.emit()
             # Re-raise the error
             raise
     
@@ -631,6 +666,7 @@ class RailwaySystem(QObject):
         self.groups.clear()
         self._next_id = 1
         self._next_group_id = 1
+        self._system_version += 1
         self.system_cleared.emit()
         
     def to_json(self) -> dict:
@@ -664,6 +700,7 @@ class RailwaySystem(QObject):
             for block_id, block_data in data['blocks'].items():
                 block = RailBlock.from_dict(block_data)
                 self.blocks[block_id] = block
+                self._system_version += 1
                 self.block_added.emit(block_id)
                 
         if 'groups' in data:
@@ -671,5 +708,6 @@ class RailwaySystem(QObject):
             for group_id, group_data in data['groups'].items():
                 group = RailGroup.from_dict(group_data)
                 self.groups[group_id] = group
+                self._system_version += 1
                 self.group_created.emit(group_id)
 
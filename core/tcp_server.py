@@ -3,11 +3,14 @@ TCP Server for Railway Block Status Updates
 Receives real-time status updates from Docker containers or external systems
 """
 
-from PySide6.QtCore import QObject, Signal, QThread
-from PySide6.QtNetwork import QTcpServer, QTcpSocket, QHostAddress
+from PySide6.QtCore import QObject, Signal, Slot, QThread, QTimer
+from PySide6.QtNetwork import QTcpServer, QTcpSocket, QHostAddress, QAbstractSocket
 import json
 from typing import Optional, Dict, List
 
+# Messages handled per client per event-loop pass, so one busy client can't starve the others
+_MAX_MESSAGES_PER_READ = 256
+
 
 class BlockStatus:
     """Block status enumeration"""
@@ -39,14 +42,14 @@ class BlockStatus:
 class ClientConnection(QObject):
     """Represents a single TCP client connection"""
     
-    message_received = Signal(str, dict)  # client_id, data
+    messages_received = Signal(str, list)  # client_id, [data, ...] from one read
     connection_lost = Signal(str)  # client_id
     
     def __init__(self, socket: QTcpSocket, client_id: str):
         super().__init__()
         self.socket = socket
         self.client_id = client_id
-        self.buffer = ""
+        self.buffer = bytearray()  # Reused across reads; holds any partial line
         
         # Connect socket signals
         self.socket.readyRead.connect(self.on_data_ready)
@@ -57,30 +60,57 @@ class ClientConnection(QObject):
         """Handle incoming data from client"""
         try:
             # Read all available data
-            data = self.socket.readAll().data().decode('utf-8')
-            self.buffer += data
+            self.buffer += self.socket.readAll().data()
+            
+            # Split off up to _MAX_MESSAGES_PER_READ complete lines, keeping the rest
+            end = -1
+            for _ in range(_MAX_MESSAGES_PER_READ):
+                next_end = self.buffer.find(b'\n', end + 1)
+                if next_end < 0:
+                    break
+                end = next_end
+            if end < 0:
+                return
+            lines = self.buffer[:end].split(b'\n')
+            del self.buffer[:end + 1]
+            
+            # Finish the backlog after other sockets have had a turn
+            if b'\n' in self.buffer:
+                QTimer.singleShot(0, self, self.on_data_ready)
             
             # Process complete messages (separated by newlines)
-            while '\n' in self.buffer:
-                line, self.buffer = self.buffer.split('\n', 1)
-                line = line.strip()
+            messages = []
+            for raw in lines:
+                line = raw.strip()
                 
                 if line:
-                    self.process_message(line)
+                    data = self.process_message(line)
+                    if data is not None:
+                        messages.append(data)
+            
+            # Hand everything from this read over in one signal
+            if messages:
+                self.messages_received.emit(self.client_id, messages)
                     
         except Exception as e:
             print(f"Error reading data from {self.client_id}: {e}")
     
-    def process_message(self, message: str):
-        """Process a single message"""
+    def process_message(self, message: bytes) -> Optional[dict]:
+        """Parse a single raw message; returns None if it is not valid JSON"""
+        # Every protocol message is a JSON object; reject anything else without raising
+        if not message.startswith(b'{'):
+            print(f"Invalid message from {self.client_id} (expected a JSON object)")
+            print(f"Message: {message.decode('utf-8', 'replace')}")
+            return None
+        
         try:
-            # Parse JSON
-            data = json.loads(message)
-            self.message_received.emit(self.client_id, data)
+            # Parse JSON straight from the bytes (json detects and decodes UTF-8 itself)
+            return json.loads(message)
             
-        except json.JSONDecodeError as e:
+        except ValueError as e:  # JSONDecodeError or invalid UTF-8
             print(f"Invalid JSON from {self.client_id}: {e}")
-            print(f"Message: {message}")
+            print(f"Message: {message.decode('utf-8', 'replace')}")
+            return None
     
     def on_disconnected(self):
         """Handle client disconnection"""
@@ -117,17 +147,20 @@ class RailwayTCPServer(QObject):
     error_occurred = Signal(str)  # error_message
     log_message = Signal(str)  # log_message
     
-    def __init__(self, port: int = 5555, host: str = "0.0.0.0"):
+    def __init__(self, port: int = 5555, host: str = "0.0.0.0", nodelay: bool = True):
         super().__init__()
         self.port = port
         self.host = host
+        self.nodelay = nodelay  # Disable Nagle so small status replies go out immediately
         self.server = QTcpServer(self)
         self.clients: Dict[str, ClientConnection] = {}
         self.next_client_id = 1
+        self._pending_updates: Optional[list] = None  # Collects updates while draining a read
         
         # Connect server signals
         self.server.newConnection.connect(self.on_new_connection)
         
+    @Slot(result=bool)
     def start(self) -> bool:
         """Start the TCP server"""
         # Determine host address
@@ -147,6 +180,7 @@ class RailwayTCPServer(QObject):
             self.error_occurred.emit(error_msg)
             return False
     
+    @Slot()
     def stop(self):
         """Stop the TCP server"""
         # Close all client connections
@@ -165,6 +199,11 @@ class RailwayTCPServer(QObject):
         if not socket:
             return
         
+        # Low-latency, kept-alive connection
+        if self.nodelay:
+            socket.setSocketOption(QAbstractSocket.LowDelayOption, 1)
+        socket.setSocketOption(QAbstractSocket.KeepAliveOption, 1)
+        
         # Create client ID
         client_id = f"client_{self.next_client_id}"
         self.next_client_id += 1
@@ -175,7 +214,7 @@ class RailwayTCPServer(QObject):
         
         # Create client connection handler
         client = ClientConnection(socket, client_id)
-        client.message_received.connect(self.on_client_message)
+        client.messages_received.connect(self.on_client_messages)
         client.connection_lost.connect(self.on_client_lost)
         
         self.clients[client_id] = client
@@ -191,6 +230,28 @@ class RailwayTCPServer(QObject):
             "protocol_version": "1.0"
         })
     
+    def on_client_messages(self, client_id: str, messages: list):
+        """Handle all messages from one client read, emitting their updates together"""
+        self._pending_updates = []
+        for data in messages:
+            self.on_client_message(client_id, data)
+        updates, self._pending_updates = self._pending_updates, None
+        self._emit_updates(updates)
+    
+    def _emit_updates(self, updates: list):
+        """Emit status updates as a single update or one batch"""
+        if len(updates) == 1:
+            self.block_status_update.emit(*updates[0])
+        elif updates:
+            self.batch_status_update.emit(updates)
+    
+    def _queue_updates(self, updates: list):
+        """Hold updates until the current read is drained, or emit them right away"""
+        if self._pending_updates is not None:
+            self._pending_updates.extend(updates)
+        else:
+            self._emit_updates(updates)
+    
     def on_client_message(self, client_id: str, data: dict):
         """Handle message from client"""
         try:
@@ -217,7 +278,7 @@ class RailwayTCPServer(QObject):
                     return
                 
                 self.log_message.emit(f"📦 Status update: {block_id} → {status}")
-                self.block_status_update.emit(block_id, status)
+                self._queue_updates([(block_id, status)])
                 
                 # Send acknowledgment
                 if client_id in self.clients:
@@ -249,7 +310,7 @@ class RailwayTCPServer(QObject):
                 
                 if valid_updates:
                     self.log_message.emit(f"📦 Batch update: {len(valid_updates)} blocks")
-                    self.batch_status_update.emit(valid_updates)
+                    self._queue_updates(valid_updates)
                     
                     # Send acknowledgment
                     if client_id in self.clients:
@@ -9,56 +9,68 @@ from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGraphicsView,
                                QComboBox, QSpinBox, QGroupBox, QFrame, QFileDialog,
                                QMessageBox)
 from PySide6.QtCore import Qt, QPointF, QRectF
-from PySide6.QtGui import QPainter, QColor, QPen, QBrush, QFont
+from PySide6.QtGui import QPainter, QColor, QPen, QBrush, QFont, QPixmap
 
 from core.railway_system import RailwaySystem
-from ui.rail_graphics import RailGraphicsItem
+from ui.rail_graphics import RailGraphicsItem, clear_scene_lookups, rail_items, refresh_rail_labels
 from controllers.editor_controller import EditorController
 from ui.styles import (
     COLORS, get_primary_button_style, get_secondary_button_style,
     get_accent_button_style, get_danger_button_style,
-    get_toggle_button_style, get_combo_box_style, get_button_style
+    get_toggle_button_style, get_combo_box_style, get_button_style,
+    SPIN_BOX_STYLE, GRAPHICS_VIEW_STYLE
 )
 
 
 class DotGridScene(QGraphicsScene):
     """Graphics scene with dot grid background"""
     
+    # Paint resources shared by every repaint
+    _BG_COLOR = QColor("#F8F9FA")
+    _DOT_COLOR = QColor("#D0D7DE")
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.grid_spacing = 20  # Spacing between dots in pixels
         self.dot_size = 2      # Size of each dot
-        self.show_grid = True
-        
-    def drawBackground(self, painter, rect):
-        """Draw dot grid background"""
-        # Fill with light background
-        painter.fillRect(rect, QColor("#F8F9FA"))
         
-        if not self.show_grid:
-            return
-        
-        # Set up dot pen
-        dot_pen = QPen(QColor("#D0D7DE"))
-        dot_pen.setWidth(self.dot_size)
-        painter.setPen(dot_pen)
+        # Qt tiles the pre-rendered grid cell natively; no drawBackground override
+        self._grid_brush = QBrush(self._create_grid_tile())
+        self._plain_brush = QBrush(self._BG_COLOR)
+        self.show_grid = True
         
-        # Calculate grid bounds
-        left = int(rect.left()) - (int(rect.left()) % self.grid_spacing)
-        top = int(rect.top()) - (int(rect.top()) % self.grid_spacing)
+    def clear(self):
+        """Remove all items; clear() deletes them without scene-change notifications"""
+        super().clear()
+        clear_scene_lookups(self)
         
-        # Draw dots
-        x = left
-        while x < rect.right():
-            y = top
-            while y < rect.bottom():
-                painter.drawPoint(x, y)
-                y += self.grid_spacing
-            x += self.grid_spacing
+    @property
+    def show_grid(self) -> bool:
+        """Whether the dot grid is drawn"""
+        return self._show_grid
+    
+    @show_grid.setter
+    def show_grid(self, visible: bool):
+        self._show_grid = visible
+        self.setBackgroundBrush(self._grid_brush if visible else self._plain_brush)
+        
+    def _create_grid_tile(self):
+        """Render one grid cell with its dot split across the four corners"""
+        spacing = self.grid_spacing
+        half = self.dot_size // 2
+        tile = QPixmap(spacing, spacing)
+        tile.fill(self._BG_COLOR)
+        
+        painter = QPainter(tile)
+        for x in (0, spacing):
+            for y in (0, spacing):
+                painter.fillRect(x - half, y - half, self.dot_size, self.dot_size, self._DOT_COLOR)
+        painter.end()
+        return tile
         
     def set_grid_color_from_theme(self):
         """Use color from centralized theme"""
-        # Grid colors are already handled in drawBackground
+        # Grid colors are already handled in _create_grid_tile
         # This method is for future theme updates
         pass
 
@@ -89,6 +101,9 @@ class EditorView(QWidget):
         # Graphics view for railway layout with dot grid
         self.scene = DotGridScene()
         self.scene.setSceneRect(-2000, -2000, 4000, 4000)
+        # Rails move constantly while editing, so skip BSP rebuilds on every setPos;
+        # snap lookups use the connection grid, leaving only click hit tests linear
+        self.scene.setItemIndexMethod(QGraphicsScene.NoIndex)
         
         self.view = QGraphicsView(self.scene)
         self.view.setRenderHint(QPainter.Antialiasing)
@@ -98,15 +113,11 @@ class EditorView(QWidget):
         self.view.setResizeAnchor(QGraphicsView.AnchorUnderMouse)
         self.view.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self.view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        # Dragging fires many small item updates; one full repaint beats merging their rects
+        self.view.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
         
         # Modern styling for the view
-        self.view.setStyleSheet("""
-            QGraphicsView {
-                border: none;
-                border-radius: 12px;
-                background-color: #F8F9FA;
-            }
-        """)
+        self.view.setStyleSheet(GRAPHICS_VIEW_STYLE)
         
         # Enable mouse tracking
         self.view.setMouseTracking(True)
@@ -181,21 +192,7 @@ class EditorView(QWidget):
         self.length_spin.setSingleStep(10)
         self.length_spin.setSuffix(" px")
         self.length_spin.valueChanged.connect(self.on_length_changed)
-        self.length_spin.setStyleSheet("""
-            QSpinBox {
-                background-color: #F7FAFC;
-                border: 2px solid #E2E8F0;
-                border-radius: 8px;
-                padding: 8px 12px;
-                color: #2D3748;
-                font-size: 13px;
-                min-width: 90px;
-            }
-            QSpinBox:hover {
-                border-color: #CBD5E0;
-                background-color: #EDF2F7;
-            }
-        """)
+        self.length_spin.setStyleSheet(SPIN_BOX_STYLE)
         toolbar_layout.addWidget(self.length_spin)
         
         toolbar_layout.addStretch()
@@ -244,6 +241,11 @@ class EditorView(QWidget):
         self.railway_system.block_added.connect(self.on_block_added)
         self.railway_system.block_removed.connect(self.on_block_removed)
         self.railway_system.system_cleared.connect(self.on_system_cleared)
+        self.railway_system.block_ids_changed.connect(self.on_block_ids_changed)
+        # Rails are cached as pixmaps, so data changed elsewhere needs an explicit repaint
+        self.railway_system.block_updated.connect(self.on_block_updated)
+        self.railway_system.block_color_changed.connect(self.on_block_color_changed)
+        self.railway_system.block_colors_changed.connect(self.on_block_colors_changed)
         
     def on_rail_type_changed(self, text: str):
         """Handle rail type selection change"""
@@ -261,16 +263,20 @@ class EditorView(QWidget):
         
     def mousePressEvent(self, event):
         """Handle mouse press in the view"""
+        # Only left clicks place rails - skip coordinate mapping and hit test otherwise
+        if event.button() != Qt.LeftButton:
+            super().mousePressEvent(event)
+            return
+        
         # Map to scene coordinates
         scene_pos = self.view.mapToScene(self.view.mapFromGlobal(event.globalPos()))
         
-        if event.button() == Qt.LeftButton:
-            # Check if clicking on background (not on an item)
-            item = self.scene.itemAt(scene_pos, self.view.transform())
-            if item is None:
-                # Add new rail at clicked position
-                self.add_rail_at_position(scene_pos.x(), scene_pos.y())
-                
+        # Check if clicking on background (not on an item)
+        item = self.scene.itemAt(scene_pos, self.view.transform())
+        if item is None:
+            # Add new rail at clicked position
+            self.add_rail_at_position(scene_pos.x(), scene_pos.y())
+        
         super().mousePressEvent(event)
         
     def add_rail_at_position(self, x: float, y: float):
@@ -299,6 +305,30 @@ class EditorView(QWidget):
         """Handle system cleared"""
         self.scene.clear()
         
+    def on_block_updated(self, block_id: str):
+        """Repaint a rail whose connections changed in the model"""
+        item = rail_items(self.scene).get(block_id)
+        if item:
+            item.sync_connection_state()
+            
+    def on_block_color_changed(self, block_id: str, color: str):
+        """Repaint a recolored rail"""
+        item = rail_items(self.scene).get(block_id)
+        if item:
+            item.update()
+            
+    def on_block_colors_changed(self, colors: dict):
+        """Repaint a batch of recolored rails"""
+        items = rail_items(self.scene)
+        for block_id in colors:
+            item = items.get(block_id)
+            if item:
+                item.update()
+                
+    def on_block_ids_changed(self):
+        """Repaint the rail labels after the blocks were renumbered"""
+        refresh_rail_labels(self.scene)
+        
     def clear_all(self):
         """Clear all rails from the layout"""
         from PySide6.QtWidgets import QMessageBox
@@ -315,7 +345,6 @@ class EditorView(QWidget):
     def toggle_grid(self, checked: bool):
         """Toggle grid display"""
         self.scene.show_grid = checked
-        self.scene.invalidate()  # Force redraw
         if checked:
             self.grid_btn.setText("⊞ Grid")
         else:
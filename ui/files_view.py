@@ -9,7 +9,11 @@ from PySide6.QtCore import Qt, Signal
 from PySide6.QtGui import QFont
 import os
 from controllers.files_controller import FilesController
-from ui.styles import get_primary_button_style, get_secondary_button_style, get_danger_button_style
+from ui.styles import (
+    get_primary_button_style, get_secondary_button_style, get_danger_button_style,
+    REFRESH_BUTTON_STYLE, DELETE_BUTTON_STYLE, OPEN_BUTTON_STYLE,
+    CHANGE_DIR_BUTTON_STYLE, DIR_CONTAINER_STYLE
+)
 
 
 class FilesView(QWidget):
@@ -51,14 +55,7 @@ class FilesView(QWidget):
         
         # Directory section
         dir_container = QFrame()
-        dir_container.setStyleSheet("""
-            QFrame {
-                background-color: #F9FAFB;
-                border: 2px solid #E5E7EB;
-                border-radius: 8px;
-                padding: 12px;
-            }
-        """)
+        dir_container.setStyleSheet(DIR_CONTAINER_STYLE)
         dir_layout = QHBoxLayout(dir_container)
         dir_layout.setContentsMargins(0, 0, 0, 0)
         
@@ -72,21 +69,7 @@ class FilesView(QWidget):
         dir_layout.addWidget(self.dir_label, 1)
         
         change_dir_btn = QPushButton("Change")
-        change_dir_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #FFFFFF;
-                color: #374151;
-                border: 2px solid #D1D5DB;
-                padding: 6px 16px;
-                font-size: 11px;
-                font-weight: 600;
-                border-radius: 6px;
-            }
-            QPushButton:hover {
-                background-color: #F3F4F6;
-                border-color: #9CA3AF;
-            }
-        """)
+        change_dir_btn.setStyleSheet(CHANGE_DIR_BUTTON_STYLE)
         change_dir_btn.clicked.connect(self.change_directory)
         dir_layout.addWidget(change_dir_btn)
         
@@ -153,63 +136,19 @@ class FilesView(QWidget):
         button_layout = QHBoxLayout(button_frame)
         
         refresh_btn = QPushButton("🔄 Refresh")
-        refresh_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #F3F4F6;
-                color: #374151;
-                border: 2px solid #E5E7EB;
-                padding: 10px 20px;
-                font-size: 13px;
-                font-weight: 600;
-                border-radius: 8px;
-            }
-            QPushButton:hover {
-                background-color: #E5E7EB;
-                border-color: #D1D5DB;
-            }
-        """)
+        refresh_btn.setStyleSheet(REFRESH_BUTTON_STYLE)
         refresh_btn.clicked.connect(self.refresh_file_list)
         button_layout.addWidget(refresh_btn)
         
         button_layout.addStretch()
         
         delete_btn = QPushButton("🗑️ Delete")
-        delete_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #FEF2F2;
-                color: #DC2626;
-                border: 2px solid #FCA5A5;
-                padding: 10px 20px;
-                font-size: 13px;
-                font-weight: 600;
-                border-radius: 8px;
-            }
-            QPushButton:hover {
-                background-color: #FEE2E2;
-                border-color: #F87171;
-            }
-        """)
+        delete_btn.setStyleSheet(DELETE_BUTTON_STYLE)
         delete_btn.clicked.connect(self.delete_selected_file)
         button_layout.addWidget(delete_btn)
         
         open_btn = QPushButton("📂 Open Selected")
-        open_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #10B981;
-                color: white;
-                border: none;
-                padding: 10px 24px;
-                font-size: 13px;
-                font-weight: 600;
-                border-radius: 8px;
-            }
-            QPushButton:hover {
-                background-color: #059669;
-            }
-            QPushButton:pressed {
-                background-color: #047857;
-            }
-        """)
+        open_btn.setStyleSheet(OPEN_BUTTON_STYLE)
         open_btn.clicked.connect(self.open_selected_file)
         button_layout.addWidget(open_btn)
         
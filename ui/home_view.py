@@ -4,8 +4,52 @@ Refactored to use centralized styles from theme
 """
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont
-from ui.styles import COLORS
+from ui.styles import COLORS, FONT_TITLE, FONT_SECTION, FONT_BODY, emoji_pixmap
+
+
+# One stylesheet for the whole view; labels are matched by object name
+_HOME_QSS = f"""
+    QWidget {{
+        background-color: {COLORS['background']};
+    }}
+    QLabel#viewTitle {{
+        color: {COLORS['text_primary']};
+        background: transparent;
+    }}
+    QLabel#featureIcon {{
+        background: transparent;
+    }}
+    QLabel#featureTitle {{
+        color: {COLORS['text_secondary']};
+        background: transparent;
+    }}
+    QLabel#featureDesc {{
+        color: {COLORS['text_muted']};
+        background: transparent;
+    }}
+"""
+
+# Feature sections shown on the home page: (icon, title, description)
+_FEATURES = [
+    (
+        "🎯",
+        "Build layouts with track blocks, turnouts, and signals",
+        "Drag and drop rail components to create your railway layout.\n"
+        "Connect tracks, add turnouts, and organize your railway system visually.",
+    ),
+    (
+        "💾",
+        "Save and load layouts in JSON format",
+        "Export your railway layouts to JSON files with full track connections.\n"
+        "Load and continue editing your saved layouts at any time.",
+    ),
+    (
+        "🌐",
+        "Monitor and update your layout in real-time via Ethernet",
+        "Connect to your railway control system via TCP network.\n"
+        "See real-time updates of train positions and track status.",
+    ),
+]
 
 
 class HomeView(QWidget):
@@ -23,99 +67,46 @@ class HomeView(QWidget):
         
         # Title
         title = QLabel("Welcome to RailwayStudio")
-        title_font = QFont("Arial", 28, QFont.Bold)
-        title.setFont(title_font)
-        title.setStyleSheet(f"color: {COLORS['text_primary']}; background: transparent;")
+        title.setFont(FONT_TITLE)
+        title.setObjectName("viewTitle")
         layout.addWidget(title)
         
         layout.addSpacing(20)
         
-        # Feature 1: Build layouts
-        feature1_layout = QVBoxLayout()
-        feature1_layout.setSpacing(10)
-        
-        feature1_icon = QLabel("🎯")
-        feature1_icon.setFont(QFont("Arial", 32))
-        feature1_icon.setStyleSheet("background: transparent;")
-        feature1_layout.addWidget(feature1_icon)
-        
-        feature1_title = QLabel("Build layouts with track blocks, turnouts, and signals")
-        feature1_title.setFont(QFont("Arial", 16, QFont.Bold))
-        feature1_title.setStyleSheet(f"color: {COLORS['text_secondary']}; background: transparent;")
-        feature1_layout.addWidget(feature1_title)
-        
-        feature1_desc = QLabel(
-            "Drag and drop rail components to create your railway layout.\n"
-            "Connect tracks, add turnouts, and organize your railway system visually."
-        )
-        feature1_desc.setFont(QFont("Arial", 12))
-        feature1_desc.setStyleSheet(f"color: {COLORS['text_muted']}; background: transparent;")
-        feature1_desc.setWordWrap(True)
-        feature1_layout.addWidget(feature1_desc)
-        
-        layout.addLayout(feature1_layout)
-        layout.addSpacing(10)
-        
-        # Feature 2: Save and load
-        feature2_layout = QVBoxLayout()
-        feature2_layout.setSpacing(10)
-        
-        feature2_icon = QLabel("💾")
-        feature2_icon.setFont(QFont("Arial", 32))
-        feature2_icon.setStyleSheet("background: transparent;")
-        feature2_layout.addWidget(feature2_icon)
-        
-        feature2_title = QLabel("Save and load layouts in JSON format")
-        feature2_title.setFont(QFont("Arial", 16, QFont.Bold))
-        feature2_title.setStyleSheet(f"color: {COLORS['text_secondary']}; background: transparent;")
-        feature2_layout.addWidget(feature2_title)
+        # Feature sections
+        for i, (icon, title_text, desc_text) in enumerate(_FEATURES):
+            if i:
+                layout.addSpacing(10)
+            self._add_feature(layout, icon, title_text, desc_text)
         
-        feature2_desc = QLabel(
-            "Export your railway layouts to JSON files with full track connections.\n"
-            "Load and continue editing your saved layouts at any time."
-        )
-        feature2_desc.setFont(QFont("Arial", 12))
-        feature2_desc.setStyleSheet(f"color: {COLORS['text_muted']}; background: transparent;")
-        feature2_desc.setWordWrap(True)
-        feature2_layout.addWidget(feature2_desc)
-        
-        layout.addLayout(feature2_layout)
-        layout.addSpacing(10)
-        
-        # Feature 3: Monitor
-        feature3_layout = QVBoxLayout()
-        feature3_layout.setSpacing(10)
+        # Add stretch to push content to top
+        layout.addStretch()
         
-        feature3_icon = QLabel("🌐")
-        feature3_icon.setFont(QFont("Arial", 32))
-        feature3_icon.setStyleSheet("background: transparent;")
-        feature3_layout.addWidget(feature3_icon)
+        # Set layout
+        self.setLayout(layout)
         
-        feature3_title = QLabel("Monitor and update your layout in real-time via Ethernet")
-        feature3_title.setFont(QFont("Arial", 16, QFont.Bold))
-        feature3_title.setStyleSheet(f"color: {COLORS['text_secondary']}; background: transparent;")
-        feature3_layout.addWidget(feature3_title)
+        # Style all labels with a single parent stylesheet
+        self.setStyleSheet(_HOME_QSS)
         
-        feature3_desc = QLabel(
-            "Connect to your railway control system via TCP network.\n"
-            "See real-time updates of train positions and track status."
-        )
-        feature3_desc.setFont(QFont("Arial", 12))
-        feature3_desc.setStyleSheet(f"color: {COLORS['text_muted']}; background: transparent;")
-        feature3_desc.setWordWrap(True)
-        feature3_layout.addWidget(feature3_desc)
+    def _add_feature(self, layout, icon, title, desc):
+        """Add a feature section (icon, title and description) to the layout"""
+        feature_layout = QVBoxLayout()
+        feature_layout.setSpacing(10)
         
-        layout.addLayout(feature3_layout)
+        icon_label = QLabel()
+        icon_label.setPixmap(emoji_pixmap(icon, 48))
+        icon_label.setObjectName("featureIcon")
+        feature_layout.addWidget(icon_label)
         
-        # Add stretch to push content to top
-        layout.addStretch()
+        title_label = QLabel(title)
+        title_label.setFont(FONT_SECTION)
+        title_label.setObjectName("featureTitle")
+        feature_layout.addWidget(title_label)
         
-        # Set layout
-        self.setLayout(layout)
+        desc_label = QLabel(desc)
+        desc_label.setFont(FONT_BODY)
+        desc_label.setObjectName("featureDesc")
+        desc_label.setWordWrap(True)
+        feature_layout.addWidget(desc_label)
         
-        # Set background color - clean light background using theme
-        self.setStyleSheet(f"""
-            QWidget {{
-                background-color: {COLORS['background']};
-            }}
-        """)
+        layout.addLayout(feature_layout)
\ No newline at end of file
@@ -5,10 +5,24 @@ Modern UI with enhanced sidebar navigation
 
 from PySide6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                                QPushButton, QFileDialog, QMessageBox,
-                               QLabel, QStackedWidget, QFrame)
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont, QAction
+                               QLabel, QStackedWidget, QFrame, QApplication)
+from PySide6.QtCore import Qt, QSize, QObject, QThread, Signal, Slot
+from PySide6.QtGui import QAction, QIcon
 import json
+import os
+import traceback
+from functools import partial
+
+try:
+    import orjson  # Optional: faster JSON for large layouts
+except ImportError:
+    orjson = None
+
+# Include full tracebacks in error dialogs only when debugging
+_DEBUG = os.environ.get("RAILWAYSTUDIO_DEBUG") == "1"
+
+# How long transient status bar messages stay up
+_STATUS_MS = 3000
 
 from ui.home_view import HomeView
 from ui.editor_view import EditorView
@@ -16,15 +30,156 @@ from ui.monitor_view import MonitorView
 from ui.files_view import FilesView
 from ui.settings_view import SettingsView
 from core.railway_system import RailwaySystem
-from core.json_formatter import RailwayJSONFormatter
+from core.json_formatter import RailwayJSONFormatter, parse_json_file
 from controllers.settings_controller import SettingsController
+from ui.styles import FONT_NAV, FONT_SIDEBAR_TITLE, emoji_pixmap
+
+
+# Sidebar and menubar stylesheets; the sidebar one also styles its children
+_SIDEBAR_QSS = """
+    QFrame {
+        background-color: #2C3E50;
+        border-right: 2px solid #34495E;
+    }
+    QFrame#sidebarTitleSection, QFrame#sidebarTitleSection QFrame {
+        background-color: #34495E;
+        padding: 15px 10px;
+    }
+    QLabel#sidebarTitle {
+        color: #ECF0F1;
+        line-height: 1.2;
+    }
+    QPushButton#navBtn {
+        background-color: transparent;
+        color: #BDC3C7;
+        text-align: left;
+        padding-left: 20px;
+        border: none;
+    }
+    QPushButton#navBtn:hover {
+        background-color: #34495E;
+        color: #ECF0F1;
+    }
+    QPushButton#navBtn[active="true"] {
+        background-color: #3498DB;
+        color: #FFFFFF;
+        border-left: 4px solid #2980B9;
+    }
+"""
+
+_MENUBAR_QSS = """
+    QMenuBar {
+        background-color: #1F2937;
+        color: #F3F4F6;
+        padding: 4px;
+    }
+    QMenuBar::item {
+        background-color: transparent;
+        padding: 8px 12px;
+    }
+    QMenuBar::item:selected {
+        background-color: #374151;
+    }
+    QMenu {
+        background-color: #1F2937;
+        color: #F3F4F6;
+        border: 1px solid #374151;
+    }
+    QMenu::item {
+        padding: 8px 25px;
+    }
+    QMenu::item:selected {
+        background-color: #374151;
+    }
+"""
+
+
+
+def _error_details() -> str:
+    """Traceback of the exception being handled, in debug mode only"""
+    return traceback.format_exc() if _DEBUG else ""
+
+
+def _stop_thread(thread):
+    """Quit a worker thread and wait for it; safe to call more than once"""
+    if thread.isRunning():
+        thread.quit()
+        thread.wait()
+
+
+class _JsonWorker(QObject):
+    """Reads and writes layout files off the GUI thread"""
+    
+    saved = Signal(str)  # file_path
+    loaded = Signal(object, str)  # data, file_path
+    error = Signal(str, str, str)  # operation, message, details
+    
+    @Slot(object, str)
+    def save(self, data, file_path):
+        """Write layout data to a file"""
+        try:
+            if orjson is not None:
+                with open(file_path, 'wb') as f:
+                    f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(file_path, 'w') as f:
+                    json.dump(data, f, indent=2)
+            self.saved.emit(file_path)
+        except (OSError, TypeError, ValueError) as e:
+            self.error.emit("save", str(e), _error_details())
+            
+    @Slot(str)
+    def load(self, file_path):
+        """Read and parse a layout file"""
+        try:
+            with open(file_path, 'rb') as f:
+                data = parse_json_file(f)
+            self.loaded.emit(data, file_path)
+        except (OSError, ValueError) as e:
+            self.error.emit("load", str(e), _error_details())
 
 
 class MainWindow(QMainWindow):
+    # Requests handled by the file I/O worker thread
+    _save_requested = Signal(object, str)
+    _load_requested = Signal(str)
+    
     def __init__(self):
         super().__init__()
         self.railway_system = RailwaySystem()
+        self.formatter = RailwayJSONFormatter(self.railway_system)
         self.current_file = None
+        self._current_index = -1
+        self._monitor_seen_version = -1
+        
+        # Track unsaved layout edits so repeated saves can be skipped; color changes
+        # come from live monitor status, not editing, so they don't count
+        self._dirty = False
+        self._saving_version = -1
+        for signal in (self.railway_system.block_added,
+                       self.railway_system.block_removed,
+                       self.railway_system.block_updated,
+                       self.railway_system.system_cleared,
+                       self.railway_system.group_created,
+                       self.railway_system.group_updated):
+            signal.connect(self.mark_dirty)
+        
+        # File I/O runs on a worker thread so large layouts don't freeze the UI
+        self._io_thread = QThread(self)
+        self._io_worker = _JsonWorker()
+        self._io_worker.moveToThread(self._io_thread)
+        self._save_requested.connect(self._io_worker.save)
+        self._load_requested.connect(self._io_worker.load)
+        self._io_worker.saved.connect(self._on_file_saved)
+        self._io_worker.loaded.connect(self._on_file_loaded)
+        self._io_worker.error.connect(self._on_io_error)
+        self._io_thread.finished.connect(self._io_worker.deleteLater)
+        self._io_thread.start()
+        
+        # Stop the thread even when the window is destroyed without being closed
+        io_thread = self._io_thread
+        QApplication.instance().aboutToQuit.connect(self._stop_io_thread)
+        self.destroyed.connect(lambda: _stop_thread(io_thread))
         
         # Create shared settings controller
         self.settings_controller = SettingsController()
@@ -53,40 +208,69 @@ class MainWindow(QMainWindow):
         
         # Right content area
         self.stacked_widget = QStackedWidget()
+        self.stacked_widget.setUpdatesEnabled(False)
         
-        # Create views (pass settings_controller to views that need it)
+        # Only the home view is built up front; the others are created on
+        # first navigation (pass settings_controller to views that need it)
         self.home_view = HomeView()
-        self.editor_view = EditorView(self.railway_system)
-        self.monitor_view = MonitorView(self.railway_system, self.settings_controller)
-        self.files_view = FilesView()
-        self.settings_view = SettingsView(self.settings_controller)
-        
-        # Add views to stacked widget
-        self.stacked_widget.addWidget(self.home_view)       # Index 0
-        self.stacked_widget.addWidget(self.editor_view)     # Index 1
-        self.stacked_widget.addWidget(self.monitor_view)    # Index 2
-        self.stacked_widget.addWidget(self.files_view)      # Index 3
-        self.stacked_widget.addWidget(self.settings_view)   # Index 4
-        
-        # Connect signals
-        self.files_view.file_selected.connect(self.load_file_from_path)
-        self.settings_view.settings_changed.connect(self.on_settings_changed)
+        self.stacked_widget.addWidget(self.home_view)
+        self._views = {0: self.home_view}
+        self._view_factories = {
+            1: self._create_editor_view,
+            2: partial(MonitorView, self.railway_system, self.settings_controller),
+            3: self._create_files_view,
+            4: self._create_settings_view,
+        }
+        self.stacked_widget.setUpdatesEnabled(True)
         
         main_layout.addWidget(self.stacked_widget)
         
         # Show home by default
         self.show_view(0)
         
+    def _create_editor_view(self):
+        """Create the editor view and populate it from the current system"""
+        view = EditorView(self.railway_system)
+        view.refresh()
+        return view
+        
+    def _create_files_view(self):
+        """Create the files view and connect its signals"""
+        view = FilesView()
+        view.file_selected.connect(self.load_file_from_path)
+        return view
+        
+    def _create_settings_view(self):
+        """Create the settings view and connect its signals"""
+        view = SettingsView(self.settings_controller)
+        view.settings_changed.connect(self.on_settings_changed)
+        return view
+        
+    def _get_view(self, index):
+        """Return the view for an index, creating it on first use"""
+        view = self._views.get(index)
+        if view is None:
+            # Batch the insert so the stack repaints once
+            self.stacked_widget.setUpdatesEnabled(False)
+            view = self._view_factories[index]()
+            self._views[index] = view
+            self.stacked_widget.addWidget(view)
+            self.stacked_widget.setUpdatesEnabled(True)
+        return view
+        
+    def _refresh_views(self):
+        """Refresh the editor and monitor views if they have been created"""
+        for index in (1, 2):
+            if index in self._views:
+                self._views[index].refresh()
+        if 2 in self._views:
+            self._monitor_seen_version = self.railway_system.version
+        
     def create_sidebar(self):
         """Create the modern left sidebar with navigation"""
         sidebar = QFrame()
         sidebar.setFixedWidth(200)
-        sidebar.setStyleSheet("""
-            QFrame {
-                background-color: #2C3E50;
-                border-right: 2px solid #34495E;
-            }
-        """)
+        sidebar.setStyleSheet(_SIDEBAR_QSS)
         
         layout = QVBoxLayout(sidebar)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -94,26 +278,22 @@ class MainWindow(QMainWindow):
         
         # App title section
         title_section = QFrame()
-        title_section.setStyleSheet("""
-            QFrame {
-                background-color: #34495E;
-                padding: 15px 10px;
-            }
-        """)
+        title_section.setObjectName("sidebarTitleSection")
         title_layout = QVBoxLayout(title_section)
         title_layout.setContentsMargins(0, 0, 0, 0)
         
         title = QLabel("Railway\nStudio")
-        title.setFont(QFont("Arial", 14, QFont.Bold))
+        title.setFont(FONT_SIDEBAR_TITLE)
         title.setAlignment(Qt.AlignCenter)
-        title.setStyleSheet("color: #ECF0F1; line-height: 1.2;")
+        title.setObjectName("sidebarTitle")
         title_layout.addWidget(title)
         
         layout.addWidget(title_section)
         
         layout.addSpacing(10)
         
-        # Navigation buttons
+        # Navigation buttons (added with updates off, repainted once)
+        sidebar.setUpdatesEnabled(False)
         self.nav_buttons = []
         
         # Home button
@@ -142,6 +322,7 @@ class MainWindow(QMainWindow):
         btn_settings = self.create_nav_button("⚙️", "Settings", 4)
         layout.addWidget(btn_settings)
         self.nav_buttons.append(btn_settings)
+        sidebar.setUpdatesEnabled(True)
         
         # Add stretch to push everything to top
         layout.addStretch()
@@ -150,92 +331,48 @@ class MainWindow(QMainWindow):
         
     def create_nav_button(self, icon, text, view_index):
         """Create a navigation button"""
-        btn = QPushButton(f"{icon}  {text}")
+        btn = QPushButton(f"  {text}")
+        btn.setIcon(QIcon(emoji_pixmap(icon, 24)))
+        btn.setIconSize(QSize(24, 24))
         btn.setFixedHeight(50)
         btn.setCursor(Qt.PointingHandCursor)
-        btn.setFont(QFont("Arial", 14))
-        btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                color: #BDC3C7;
-                text-align: left;
-                padding-left: 20px;
-                border: none;
-            }
-            QPushButton:hover {
-                background-color: #34495E;
-                color: #ECF0F1;
-            }
-        """)
-        btn.clicked.connect(lambda: self.show_view(view_index))
+        btn.setFont(FONT_NAV)
+        btn.setObjectName("navBtn")
+        btn.clicked.connect(partial(self.show_view, view_index))
         return btn
         
+    def _set_nav_active(self, btn, active):
+        """Toggle a nav button's active state and re-polish its style"""
+        btn.setProperty("active", active)
+        btn.style().unpolish(btn)
+        btn.style().polish(btn)
+        
     def show_view(self, index):
         """Show a specific view and update button styles"""
-        self.stacked_widget.setCurrentIndex(index)
-        
-        # Update button styles
-        for i, btn in enumerate(self.nav_buttons):
-            if i == index:
-                # Active state
-                btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #3498DB;
-                        color: #FFFFFF;
-                        text-align: left;
-                        padding-left: 20px;
-                        border: none;
-                        border-left: 4px solid #2980B9;
-                    }
-                """)
-            else:
-                # Inactive state
-                btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: transparent;
-                        color: #BDC3C7;
-                        text-align: left;
-                        padding-left: 20px;
-                        border: none;
-                    }
-                    QPushButton:hover {
-                        background-color: #34495E;
-                        color: #ECF0F1;
-                    }
-                """)
+        # Already showing this view with its button marked active
+        if (self.stacked_widget.currentWidget() is self._views.get(index)
+                and self.nav_buttons[index].property("active")):
+            return
+        
+        view = self._get_view(index)
+        self.stacked_widget.setCurrentWidget(view)
+        
+        # Flip the active property on the two buttons whose state changes
+        if self._current_index >= 0:
+            self._set_nav_active(self.nav_buttons[self._current_index], False)
+        self._set_nav_active(self.nav_buttons[index], True)
+        self._current_index = index
         
         # Special handling for monitor view
         if index == 2:  # Monitor view
-            self.monitor_view.refresh()
+            if self.railway_system.version != self._monitor_seen_version:
+                view.refresh()
+                self._monitor_seen_version = self.railway_system.version
             
     def setup_menubar(self):
         """Setup the menu bar"""
         menubar = self.menuBar()
-        menubar.setStyleSheet("""
-            QMenuBar {
-                background-color: #1F2937;
-                color: #F3F4F6;
-                padding: 4px;
-            }
-            QMenuBar::item {
-                background-color: transparent;
-                padding: 8px 12px;
-            }
-            QMenuBar::item:selected {
-                background-color: #374151;
-            }
-            QMenu {
-                background-color: #1F2937;
-                color: #F3F4F6;
-                border: 1px solid #374151;
-            }
-            QMenu::item {
-                padding: 8px 25px;
-            }
-            QMenu::item:selected {
-                background-color: #374151;
-            }
-        """)
+        menubar.setStyleSheet(_MENUBAR_QSS)
         
         # File menu
         file_menu = menubar.addMenu("File")
@@ -271,15 +408,15 @@ class MainWindow(QMainWindow):
         view_menu = menubar.addMenu("View")
         
         home_action = QAction("Home", self)
-        home_action.triggered.connect(lambda: self.show_view(0))
+        home_action.triggered.connect(partial(self.show_view, 0))
         view_menu.addAction(home_action)
         
         editor_action = QAction("Editor", self)
-        editor_action.triggered.connect(lambda: self.show_view(1))
+        editor_action.triggered.connect(partial(self.show_view, 1))
         view_menu.addAction(editor_action)
         
         monitor_action = QAction("Monitor", self)
-        monitor_action.triggered.connect(lambda: self.show_view(2))
+        monitor_action.triggered.connect(partial(self.show_view, 2))
         view_menu.addAction(monitor_action)
         
         # Help menu
@@ -302,8 +439,7 @@ class MainWindow(QMainWindow):
         if reply == QMessageBox.Yes:
             self.railway_system.clear()
             self.current_file = None
-            self.editor_view.refresh()
-            self.monitor_view.refresh()
+            self._refresh_views()
             self.show_view(1)  # Switch to editor
             
     def open_layout(self):
@@ -338,90 +474,113 @@ class MainWindow(QMainWindow):
             if not file_path.endswith('.json'):
                 file_path += '.json'
             self._save_to_file(file_path)
-            self.current_file = file_path
             
+    def mark_dirty(self, *args):
+        """Mark the layout as changed since the last save or load"""
+        self._dirty = True
+        
     def _save_to_file(self, file_path):
         """Internal method to save to a specific file"""
+        # Nothing changed since the last save to this file
+        if not self._dirty and file_path == self.current_file:
+            self.statusBar().showMessage("No changes to save", _STATUS_MS)
+            return
+        
+        # Check if there are any blocks
+        if not self.railway_system.blocks:
+            QMessageBox.warning(
+                self,
+                "Empty Layout",
+                "Cannot save an empty layout. Please add some rails first."
+            )
+            return
+        
+        # Convert to blockGroups format
         try:
-            # Check if there are any blocks
-            if not self.railway_system.blocks:
-                QMessageBox.warning(
-                    self,
-                    "Empty Layout",
-                    "Cannot save an empty layout. Please add some rails first."
-                )
-                return
+            data = self.formatter.to_blockgroups_json()
+        except ValueError as e:
+            # Validation error
+            QMessageBox.critical(
+                self,
+                "❌ CANNOT SAVE - Connection Validation Failed!",
+                f"{str(e)}\n\n"
+                f"Please fix these issues before saving:\n"
+                f"1. Connect all disconnected rails\n"
+                f"2. Ensure all blocks are properly linked\n"
+                f"3. Click 'Auto-Create Groups' to validate"
+            )
+            return
+        
+        # Write the file on the worker thread; it only counts as saved once the worker reports back
+        self._saving_version = self.railway_system.version
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        self._save_requested.emit(data, file_path)
+        
+    def _on_file_saved(self, file_path):
+        """Handle a layout file written by the worker"""
+        QApplication.restoreOverrideCursor()
+        
+        # Point at the written file; edits made while it was being written keep the layout dirty
+        self.current_file = file_path
+        if self.railway_system.version == self._saving_version:
+            self._dirty = False
+        
+        QMessageBox.information(
+            self,
+            "✓ Layout Saved",
+            f"Layout saved successfully to:\n{file_path}"
+        )
+        
+    def load_file_from_path(self, file_path):
+        """Load a layout file from the given path"""
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        self._load_requested.emit(file_path)
+        
+    def _on_file_loaded(self, data, file_path):
+        """Apply layout data parsed by the worker"""
+        QApplication.restoreOverrideCursor()
+        try:
+            # Check if it's the new blockGroups format or old format
+            if "blockGroups" in data:
+                # New format
+                self.formatter.from_blockgroups_json(data)
+            else:
+                # Old format (backward compatibility)
+                self.railway_system.load_from_json(data)
             
-            # Convert to blockGroups format
-            formatter = RailwayJSONFormatter(self.railway_system)
-            try:
-                data = formatter.to_blockgroups_json()
-            except ValueError as e:
-                # Validation error
-                QMessageBox.critical(
-                    self,
-                    "❌ CANNOT SAVE - Connection Validation Failed!",
-                    f"{str(e)}\n\n"
-                    f"Please fix these issues before saving:\n"
-                    f"1. Connect all disconnected rails\n"
-                    f"2. Ensure all blocks are properly linked\n"
-                    f"3. Click 'Auto-Create Groups' to validate"
-                )
-                return
+            self._refresh_views()
+            self.current_file = file_path
+            self._dirty = False
             
-            # Save to file
-            with open(file_path, 'w') as f:
-                json.dump(data, f, indent=2)
+            # Switch to editor view
+            self.show_view(1)
             
             QMessageBox.information(
                 self,
-                "✓ Layout Saved",
-                f"Layout saved successfully to:\n{file_path}"
+                "✓ Success",
+                f"Layout loaded successfully:\n{file_path}"
             )
+        except (KeyError, TypeError, ValueError) as e:
+            self._show_io_error("load", str(e), _error_details())
             
-        except Exception as e:
-            import traceback
-            error_details = traceback.format_exc()
+    def _on_io_error(self, operation, message, details):
+        """Handle a save or load that failed on the worker"""
+        QApplication.restoreOverrideCursor()
+        self._show_io_error(operation, message, details)
+        
+    def _show_io_error(self, operation, message, details):
+        """Report a failed save or load"""
+        if operation == "save":
             QMessageBox.critical(
                 self,
                 "Error",
-                f"Failed to save layout:\n{str(e)}\n\n{error_details}"
+                f"Failed to save layout:\n{message}\n\n{details}"
             )
-            
-    def load_file_from_path(self, file_path):
-        """Load a layout file from the given path"""
-        try:
-            with open(file_path, 'r') as f:
-                data = json.load(f)
-                
-                # Check if it's the new blockGroups format or old format
-                if "blockGroups" in data:
-                    # New format
-                    formatter = RailwayJSONFormatter(self.railway_system)
-                    formatter.from_blockgroups_json(data)
-                else:
-                    # Old format (backward compatibility)
-                    self.railway_system.load_from_json(data)
-                
-                self.editor_view.refresh()
-                self.monitor_view.refresh()
-                self.current_file = file_path
-                
-                # Switch to editor view
-                self.show_view(1)
-                
-                QMessageBox.information(
-                    self,
-                    "✓ Success",
-                    f"Layout loaded successfully:\n{file_path}"
-                )
-        except Exception as e:
-            import traceback
-            error_details = traceback.format_exc()
+        else:
             QMessageBox.critical(
                 self,
                 "❌ Error",
-                f"Failed to load layout:\n{str(e)}\n\n{error_details}"
+                f"Failed to load layout:\n{message}\n\n{details}"
             )
             
     def on_settings_changed(self, settings):
@@ -446,3 +605,15 @@ class MainWindow(QMainWindow):
             "</ul>"
             "<p>Built with PySide6 (Qt for Python)</p>"
         )
+        
+    def closeEvent(self, event):
+        """Stop the worker threads before closing"""
+        monitor = self._views.get(2)
+        if monitor is not None and monitor.controller.is_listening:
+            monitor.controller.stop_tcp_server()
+        self._stop_io_thread()
+        super().closeEvent(event)
+        
+    def _stop_io_thread(self):
+        """Quit the file I/O thread and wait for it to finish"""
+        _stop_thread(self._io_thread)
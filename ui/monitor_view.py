@@ -5,49 +5,154 @@ Modern UI with improved styling
 
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGraphicsView,
                                QGraphicsScene, QLabel, QPushButton, QSpinBox,
-                               QLineEdit, QGroupBox, QTextEdit, QFrame)
-from PySide6.QtCore import Qt, QThread, Signal, QPointF
-from PySide6.QtGui import QPainter, QColor, QBrush, QFont
+                               QLineEdit, QGroupBox, QListView, QFrame, QMessageBox,
+                               QFileDialog, QGraphicsItem)
+from PySide6.QtCore import (Qt, QThread, QThreadPool, Signal, QPointF, QTimer,
+                            QAbstractListModel, QModelIndex)
+from PySide6.QtGui import (QPainter, QColor, QBrush, QFont, QPixmap, QSurfaceFormat,
+                           QOpenGLContext)
 from PySide6.QtNetwork import QTcpServer, QTcpSocket, QHostAddress
 
 from core.railway_system import RailwaySystem
 from core.tcp_server import RailwayTCPServer, BlockStatus
-from ui.rail_graphics import RailGraphicsItem
+from ui.rail_graphics import RailGraphicsItem, refresh_rail_labels
+from controllers.monitor_controller import MonitorController
 import json
 import socket
+from collections import deque
+from functools import lru_cache
+
+try:
+    from PySide6.QtOpenGLWidgets import QOpenGLWidget  # GPU-backed viewport
+except ImportError:
+    QOpenGLWidget = None
+
+
+# Shared title font and card styles
+_TITLE_FONT = QFont("Arial", 16, QFont.Bold)
+
+_CARD_QSS = """
+    QFrame {
+        background-color: #FFFFFF;
+        border-radius: 10px;
+        padding: 12px;
+    }
+"""
+
+_CARD_TITLE_QSS = "color: #2D3748; font-weight: bold; font-size: 13px;"
+
+# Number of lines kept in the network log
+_LOG_MAX_LINES = 500
+
+# Above this many rails, repaint one bounding rect instead of tracking each dirty region
+_BOUNDING_UPDATE_THRESHOLD = 1000
+
+
+@lru_cache(maxsize=None)
+def _opengl_available():
+    """Check once whether an OpenGL context can be created on this platform"""
+    return QOpenGLWidget is not None and QOpenGLContext().create()
+
+
+def _detect_host_ips():
+    """Return (label, ip) pairs for this host's IPv4 addresses"""
+    ip_addresses = []
+    
+    # Try to get the main IP address (connected to internet)
+    try:
+        # Create a socket to determine the main IP
+        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        s.settimeout(0.5)
+        s.connect(("8.8.8.8", 80))
+        main_ip = s.getsockname()[0]
+        s.close()
+        ip_addresses.append(("Primary", main_ip))
+    except OSError:
+        pass
+    
+    # Get all network interface IPs
+    try:
+        all_ips = socket.getaddrinfo(socket.gethostname(), None)
+        for ip_info in all_ips:
+            ip = ip_info[4][0]
+            # Filter out IPv6, localhost, and duplicates
+            if ':' not in ip and ip != '127.0.0.1' and ip not in [addr[1] for addr in ip_addresses]:
+                ip_addresses.append(("Network", ip))
+    except OSError:
+        pass
+    
+    return ip_addresses
 
 
 class DotGridScene(QGraphicsScene):
     """Graphics scene with dot grid background"""
     
+    # Grid colors, parsed once
+    _BG_COLOR = QColor("#F8F9FA")
+    _DOT_COLOR = QColor("#D0D7DE")
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.grid_spacing = 20
         self.dot_size = 2
         
-    def drawBackground(self, painter, rect):
-        """Draw dot grid background"""
-        # Fill with light background
-        painter.fillRect(rect, QColor("#F8F9FA"))
-        
-        # Set up dot pen
-        dot_pen = painter.pen()
-        dot_pen.setColor(QColor("#D0D7DE"))
-        dot_pen.setWidth(self.dot_size)
-        painter.setPen(dot_pen)
-        
-        # Calculate grid bounds
-        left = int(rect.left()) - (int(rect.left()) % self.grid_spacing)
-        top = int(rect.top()) - (int(rect.top()) % self.grid_spacing)
-        
-        # Draw dots
-        x = left
-        while x < rect.right():
-            y = top
-            while y < rect.bottom():
-                painter.drawPoint(x, y)
-                y += self.grid_spacing
-            x += self.grid_spacing
+        # The grid is periodic, so one tile drawn once is tiled by Qt as the background
+        self.setBackgroundBrush(QBrush(self._create_grid_tile()))
+        
+    def _create_grid_tile(self):
+        """Render one grid cell with its dot split across the four corners"""
+        spacing = self.grid_spacing
+        half = self.dot_size // 2
+        tile = QPixmap(spacing, spacing)
+        tile.fill(self._BG_COLOR)
+        
+        painter = QPainter(tile)
+        for x in (0, spacing):
+            for y in (0, spacing):
+                painter.fillRect(x - half, y - half, self.dot_size, self.dot_size, self._DOT_COLOR)
+        painter.end()
+        return tile
+
+
+class LogModel(QAbstractListModel):
+    """Ring buffer of log lines for a QListView"""
+    
+    def __init__(self, max_lines: int, parent=None):
+        super().__init__(parent)
+        self._lines = deque(maxlen=max_lines)
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._lines)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            return self._lines[index.row()]
+        return None
+    
+    def append_lines(self, lines: list):
+        """Append lines, dropping the oldest ones beyond the buffer size"""
+        lines = lines[-self._lines.maxlen:]
+        if not lines:
+            return
+        
+        # Remove the rows that will fall out of the ring buffer first
+        overflow = len(self._lines) + len(lines) - self._lines.maxlen
+        if overflow > 0:
+            self.beginRemoveRows(QModelIndex(), 0, overflow - 1)
+            for _ in range(overflow):
+                self._lines.popleft()
+            self.endRemoveRows()
+        
+        first = len(self._lines)
+        self.beginInsertRows(QModelIndex(), first, first + len(lines) - 1)
+        self._lines.extend(lines)
+        self.endInsertRows()
+        
+    def clear(self):
+        """Remove all lines"""
+        self.beginResetModel()
+        self._lines.clear()
+        self.endResetModel()
 
 
 # NetworkListener class removed - now using RailwayTCPServer directly
@@ -56,13 +161,69 @@ class DotGridScene(QGraphicsScene):
 class MonitorView(QWidget):
     """Monitor view for displaying railway layout with real-time updates"""
     
+    # Server toggle button and status label styles, keyed on the "running" property
+    _CSS_SERVER_BTN = """
+        QPushButton {
+            background-color: #48BB78;
+            color: white;
+            border: none;
+            border-radius: 8px;
+            padding: 10px;
+            font-weight: 600;
+            font-size: 13px;
+        }
+        QPushButton:hover {
+            background-color: #38A169;
+        }
+        QPushButton[running="true"] {
+            background-color: #E53E3E;
+        }
+        QPushButton[running="true"]:hover {
+            background-color: #C53030;
+        }
+    """
+    _CSS_SERVER_STATUS = """
+        QLabel {
+            padding: 8px;
+            background-color: #FFF5F5;
+            color: #C53030;
+            border-radius: 6px;
+            font-weight: 600;
+        }
+        QLabel[running="true"] {
+            background-color: #F0FFF4;
+            color: #22543D;
+        }
+    """
+    
+    # Host IPs shared by all monitor views once detected
+    _cached_ips = None
+    _host_ips_detected = Signal(list)
+    
     def __init__(self, railway_system: RailwaySystem, settings_controller=None):
         super().__init__()
         self.railway_system = railway_system
         self.settings_controller = settings_controller
         
+        # Rail graphics items by block id, for constant-time status updates
+        self._item_by_id: dict[str, RailGraphicsItem] = {}
+        
+        # Color changes are collected and repainted at most once per frame (~60 Hz)
+        self._dirty_ids: set[str] = set()
+        self._flush_pending = False
+        
+        # Host IP lookup runs on the thread pool and reports back through a signal
+        self._ip_lookup_pending = False
+        self._host_ips_detected.connect(self._on_host_ips_detected)
+        
+        # Log lines are buffered and appended in one go every 50 ms
+        self._log_buf = deque()
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(50)
+        self._log_timer.timeout.connect(self._flush_log)
+        
         # Initialize controller (MVC pattern)
-        from controllers.monitor_controller import MonitorController
         self.controller = MonitorController(railway_system)
         
         self.setup_ui()
@@ -92,23 +253,37 @@ class MonitorView(QWidget):
         
         # Title
         title = QLabel("📊  Railway Monitor")
-        title_font = QFont("Arial", 16, QFont.Bold)
-        title.setFont(title_font)
+        title.setFont(_TITLE_FONT)
         title.setStyleSheet("color: #1A202C;")
         left_layout.addWidget(title)
         
         # Graphics view with dot grid
         self.scene = DotGridScene()
         self.scene.setSceneRect(-2000, -2000, 4000, 4000)
+        # Read-only scene rebuilt in bulk: skip BSP maintenance on every addItem
+        self.scene.setItemIndexMethod(QGraphicsScene.NoIndex)
         
         self.view = QGraphicsView(self.scene)
+        if _opengl_available():
+            # Render through OpenGL with 4x MSAA for antialiasing
+            gl_format = QSurfaceFormat()
+            gl_format.setSamples(4)
+            viewport = QOpenGLWidget()
+            viewport.setFormat(gl_format)
+            self.view.setViewport(viewport)
         self.view.setRenderHint(QPainter.Antialiasing)
         self.view.setRenderHint(QPainter.SmoothPixmapTransform)
         self.view.setDragMode(QGraphicsView.ScrollHandDrag)
+        # Keep the grid background as a cached pixmap while panning
+        self.view.setCacheMode(QGraphicsView.CacheBackground)
         self.view.setTransformationAnchor(QGraphicsView.AnchorUnderMouse)
         self.view.setResizeAnchor(QGraphicsView.AnchorUnderMouse)
         self.view.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self.view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.view.setViewportUpdateMode(QGraphicsView.SmartViewportUpdate)
+        # Rail items set their own pen/brush and stay inside their bounding rects
+        self.view.setOptimizationFlag(QGraphicsView.DontSavePainterState, True)
+        self.view.setOptimizationFlag(QGraphicsView.DontAdjustForAntialiasing, True)
         self.view.setStyleSheet("""
             QGraphicsView {
                 border: none;
@@ -153,9 +328,7 @@ class MonitorView(QWidget):
         right_layout.addWidget(load_btn)
         
         # Network settings
-        network_card = self.create_card("🌐 TCP Server Settings")
-        network_content = QVBoxLayout()
-        network_content.setSpacing(10)
+        network_card, network_content = self.create_card("🌐 TCP Server Settings")
         
         # TCP Port
         port_layout = QHBoxLayout()
@@ -228,38 +401,17 @@ class MonitorView(QWidget):
         
         self.start_btn = QPushButton("▶ Start Listening")
         self.start_btn.clicked.connect(self.toggle_listening)
-        self.start_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #48BB78;
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 10px;
-                font-weight: 600;
-                font-size: 13px;
-            }
-            QPushButton:hover {
-                background-color: #38A169;
-            }
-        """)
+        self.start_btn.setStyleSheet(self._CSS_SERVER_BTN)
         network_content.addWidget(self.start_btn)
         
         self.status_label = QLabel("● Not listening")
-        self.status_label.setStyleSheet("""
-            padding: 8px;
-            background-color: #FFF5F5;
-            color: #C53030;
-            border-radius: 6px;
-            font-weight: 600;
-        """)
+        self.status_label.setStyleSheet(self._CSS_SERVER_STATUS)
         network_content.addWidget(self.status_label)
         
-        self.add_to_card(network_card, network_content)
         right_layout.addWidget(network_card)
         
         # # Packet format info
-        # format_card = self.create_card("📋 Packet Format")
-        # format_content = QVBoxLayout()
+        # format_card, format_content = self.create_card("📋 Packet Format")
         # format_info = QLabel(
         #     '<b>JSON format:</b><br>'
         #     '<code style="background: #F7FAFC; padding: 2px 4px; border-radius: 3px;">'
@@ -273,13 +425,10 @@ class MonitorView(QWidget):
         # format_info.setWordWrap(True)
         # format_info.setStyleSheet("font-size: 11px; color: #4A5568; line-height: 1.5;")
         # format_content.addWidget(format_info)
-        # self.add_to_card(format_card, format_content)
         # right_layout.addWidget(format_card)
         
         # Test controls
-        # test_card = self.create_card("🧪 Test Controls")
-        # test_content = QVBoxLayout()
-        # test_content.setSpacing(8)
+        # test_card, test_content = self.create_card("🧪 Test Controls")
         
         # test_content.addWidget(QLabel("Block ID:"))
         # self.test_block_id = QLineEdit()
@@ -327,18 +476,20 @@ class MonitorView(QWidget):
         # """)
         # test_content.addWidget(reset_btn)
         
-        # self.add_to_card(test_card, test_content)
         # right_layout.addWidget(test_card)
         
         # Log viewer
-        log_card = self.create_card("📝 Network Log")
-        log_content = QVBoxLayout()
-        
-        self.log_text = QTextEdit()
-        self.log_text.setReadOnly(True)
-        self.log_text.setMaximumHeight(180)
-        self.log_text.setStyleSheet("""
-            QTextEdit {
+        log_card, log_content = self.create_card("📝 Network Log")
+        
+        # Fixed-height rows over a ring buffer: no document relayout per append
+        self.log_model = LogModel(_LOG_MAX_LINES, self)
+        self.log_view = QListView()
+        self.log_view.setModel(self.log_model)
+        self.log_view.setUniformItemSizes(True)
+        self.log_view.setSelectionMode(QListView.NoSelection)
+        self.log_view.setMaximumHeight(180)
+        self.log_view.setStyleSheet("""
+            QListView {
                 background-color: #F7FAFC;
                 border: 2px solid #E2E8F0;
                 border-radius: 6px;
@@ -348,10 +499,10 @@ class MonitorView(QWidget):
                 color: #2D3748;
             }
         """)
-        log_content.addWidget(self.log_text)
+        log_content.addWidget(self.log_view)
         
         clear_log_btn = QPushButton("Clear Log")
-        clear_log_btn.clicked.connect(self.log_text.clear)
+        clear_log_btn.clicked.connect(self.log_model.clear)
         clear_log_btn.setStyleSheet("""
             QPushButton {
                 background-color: #F7FAFC;
@@ -367,7 +518,6 @@ class MonitorView(QWidget):
         """)
         log_content.addWidget(clear_log_btn)
         
-        self.add_to_card(log_card, log_content)
         right_layout.addWidget(log_card)
         
         right_layout.addStretch()
@@ -383,29 +533,19 @@ class MonitorView(QWidget):
             }
         """)
         
-    def create_card(self, title: str) -> QFrame:
-        """Create a styled card container"""
+    def create_card(self, title: str) -> tuple:
+        """Create a styled card container, returning (card, layout)"""
         card = QFrame()
-        card.setStyleSheet("""
-            QFrame {
-                background-color: #FFFFFF;
-                border-radius: 10px;
-                padding: 12px;
-            }
-        """)
+        card.setStyleSheet(_CARD_QSS)
         
         layout = QVBoxLayout(card)
         layout.setSpacing(10)
         
         title_label = QLabel(title)
-        title_label.setStyleSheet("color: #2D3748; font-weight: bold; font-size: 13px;")
+        title_label.setStyleSheet(_CARD_TITLE_QSS)
         layout.addWidget(title_label)
         
-        return card
-        
-    def add_to_card(self, card: QFrame, content_layout: QVBoxLayout):
-        """Add content to a card"""
-        card.layout().addLayout(content_layout)
+        return card, layout
         
     def get_input_style(self):
         """Get input field styling"""
@@ -427,6 +567,8 @@ class MonitorView(QWidget):
         """Connect signals - View listens to Controller and Model"""
         # Listen to Model (RailwaySystem) for data changes
         self.railway_system.block_color_changed.connect(self.on_block_color_changed)
+        self.railway_system.block_colors_changed.connect(self.on_block_colors_changed)
+        self.railway_system.block_ids_changed.connect(self.on_block_ids_changed)
         
         # Listen to Controller for business logic events
         self.controller.log_message.connect(self.append_log)
@@ -441,53 +583,35 @@ class MonitorView(QWidget):
     
     def update_host_ip_display(self):
         """Update the display of host IP addresses for Docker connection"""
-        try:
-            # Get hostname
-            hostname = socket.gethostname()
-            
-            # Get all IP addresses
-            ip_addresses = []
+        # Addresses don't change while running; detect them once, off the GUI thread
+        if MonitorView._cached_ips is not None:
+            self._on_host_ips_detected(MonitorView._cached_ips)
+            return
+        if not self._ip_lookup_pending:
+            self._ip_lookup_pending = True
+            QThreadPool.globalInstance().start(
+                lambda: self._host_ips_detected.emit(_detect_host_ips()))
             
-            # Try to get the main IP address (connected to internet)
-            try:
-                # Create a socket to determine the main IP
-                s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-                s.connect(("8.8.8.8", 80))
-                main_ip = s.getsockname()[0]
-                s.close()
-                ip_addresses.append(("Primary", main_ip))
-            except:
-                pass
-            
-            # Get all network interface IPs
-            try:
-                all_ips = socket.getaddrinfo(hostname, None)
-                for ip_info in all_ips:
-                    ip = ip_info[4][0]
-                    # Filter out IPv6, localhost, and duplicates
-                    if ':' not in ip and ip != '127.0.0.1' and ip not in [addr[1] for addr in ip_addresses]:
-                        ip_addresses.append(("Network", ip))
-            except:
-                pass
-            
-            # # Display the IP addresses
-            # if ip_addresses:
-            #     ip_text = "🔗 <b>Connect from Docker using:</b><br>"
-            #     for label, ip in ip_addresses:
-            #         ip_text += f"• {ip}:{self.port_spin.value()}<br>"
-            #     ip_text += "<br><small>Copy and use in your Docker container</small>"
-            #     self.host_ip_label.setText(ip_text)
-            # else:
-            #     self.host_ip_label.setText("⚠️ Could not detect IP addresses")
-                
-        except Exception as e:
-            self.host_ip_label.setText(f"⚠️ Error detecting IP: {str(e)}")
+    def _on_host_ips_detected(self, ip_addresses):
+        """Cache detected host IPs and show them"""
+        MonitorView._cached_ips = ip_addresses
+        self._ip_lookup_pending = False
+        
+        # # Display the IP addresses
+        # if ip_addresses:
+        #     ip_text = "🔗 <b>Connect from Docker using:</b><br>"
+        #     for label, ip in ip_addresses:
+        #         ip_text += f"• {ip}:{self.port_spin.value()}<br>"
+        #     ip_text += "<br><small>Copy and use in your Docker container</small>"
+        #     self.host_ip_label.setText(ip_text)
+        # else:
+        #     self.host_ip_label.setText("⚠️ Could not detect IP addresses")
         
     def start_network_listener(self):
         """Delegate to controller to start TCP server (View only triggers action)"""
         port = self.port_spin.value()
         bind_address = self.bind_address_input.text().strip() or "0.0.0.0"
-        self.controller.start_tcp_server(port=port, host=bind_address)
+        self.controller.start_tcp_server(port=port, host=bind_address, nodelay=True)
         
     def stop_network_listener(self):
         """Delegate to controller to stop TCP server (View only triggers action)"""
@@ -506,62 +630,28 @@ class MonitorView(QWidget):
     def on_tcp_server_started(self, port: int):
         """Handle TCP server started event from controller"""
         self.start_btn.setText("⏸ Stop Server")
-        self.start_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #E53E3E;
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 10px;
-                font-weight: 600;
-                font-size: 13px;
-            }
-            QPushButton:hover {
-                background-color: #C53030;
-            }
-        """)
         self.status_label.setText(f"● Server running on port {port}")
-        self.status_label.setStyleSheet("""
-            padding: 8px;
-            background-color: #F0FFF4;
-            color: #22543D;
-            border-radius: 6px;
-            font-weight: 600;
-        """)
+        self._set_running_state(True)
         self.port_spin.setEnabled(False)
         self.update_host_ip_display()
     
     def on_tcp_server_stopped(self):
         """Handle TCP server stopped event from controller"""
         self.start_btn.setText("▶ Start Server")
-        self.start_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #48BB78;
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 10px;
-                font-weight: 600;
-                font-size: 13px;
-            }
-            QPushButton:hover {
-                background-color: #38A169;
-            }
-        """)
         self.status_label.setText("● Server stopped")
-        self.status_label.setStyleSheet("""
-            padding: 8px;
-            background-color: #FFF5F5;
-            color: #C53030;
-            border-radius: 6px;
-            font-weight: 600;
-        """)
+        self._set_running_state(False)
         self.port_spin.setEnabled(True)
         self.clients_label.setText("Connected clients: 0")
     
+    def _set_running_state(self, running: bool):
+        """Flip the server widgets' "running" property and re-polish their styles"""
+        for widget in (self.start_btn, self.status_label):
+            widget.setProperty("running", running)
+            widget.style().unpolish(widget)
+            widget.style().polish(widget)
+    
     def on_tcp_server_error(self, error_msg: str):
         """Handle TCP server error from controller"""
-        from PySide6.QtWidgets import QMessageBox
         QMessageBox.warning(self, "TCP Server Error", error_msg)
     
     def on_client_count_changed(self, count: int):
@@ -570,11 +660,34 @@ class MonitorView(QWidget):
             
     def on_block_color_changed(self, block_id: str, color: str):
         """Handle block color change"""
-        # Update graphics item
-        for item in self.scene.items():
-            if isinstance(item, RailGraphicsItem) and item.block.id == block_id:
+        # Color changes only repaint the rail items; the cached background
+        # layer is invalidated in refresh() when the scene rect changes
+        
+        # Defer the repaint to the next frame flush
+        self._dirty_ids.add(block_id)
+        if not self._flush_pending:
+            self._flush_pending = True
+            QTimer.singleShot(16, self._flush_dirty)
+            
+    def on_block_colors_changed(self, colors: dict):
+        """Handle a batch of block color changes"""
+        self._dirty_ids.update(colors)
+        if not self._flush_pending:
+            self._flush_pending = True
+            QTimer.singleShot(16, self._flush_dirty)
+            
+    def on_block_ids_changed(self):
+        """Repaint the rail labels after the blocks were renumbered"""
+        refresh_rail_labels(self.scene)
+        
+    def _flush_dirty(self):
+        """Repaint every rail whose color changed since the last flush"""
+        for block_id in self._dirty_ids:
+            item = self._item_by_id.get(block_id)
+            if item:
                 item.update()
-                break
+        self._dirty_ids.clear()
+        self._flush_pending = False
                 
     # These methods are commented out as they're not used in current UI
     # def test_color_change(self):
@@ -589,12 +702,19 @@ class MonitorView(QWidget):
         
     def append_log(self, message: str):
         """Add message to log (View only displays, message formatting done in Controller)"""
-        self.log_text.append(message)
+        self._log_buf.append(message)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+            
+    def _flush_log(self):
+        """Append all buffered log messages at once"""
+        if self._log_buf:
+            self.log_model.append_lines("\n".join(self._log_buf).splitlines())
+            self.log_view.scrollToBottom()
+            self._log_buf.clear()
     
     def load_layout(self):
         """Load a layout from file (View only handles UI, Controller handles logic)"""
-        from PySide6.QtWidgets import QFileDialog, QMessageBox
-        
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "Open Layout",
@@ -623,25 +743,55 @@ class MonitorView(QWidget):
         self.bind_address_input.setText(bind_address)
         
         # Log the update (only if log widget exists)
-        if hasattr(self, 'log_text'):
+        if hasattr(self, 'log_view'):
             self.append_log(f"📡 Network settings updated: Port {port}, Bind address {bind_address}")
         
         # If currently listening, restart with new settings
         if self.controller.is_listening:
             self.controller.stop_tcp_server()
-            self.controller.start_tcp_server(port=port, host=bind_address)
+            self.controller.start_tcp_server(port=port, host=bind_address, nodelay=True)
     
     def refresh(self):
         """Refresh the view from railway system"""
-        from PySide6.QtWidgets import QGraphicsItem
-        
-        self.scene.clear()
-        for block_id in self.railway_system.blocks:
-            block = self.railway_system.blocks[block_id]
+        blocks = self.railway_system.blocks
+        
+        # Drop items whose block was removed or replaced (e.g. by a reload)
+        for block_id in list(self._item_by_id):
+            item = self._item_by_id[block_id]
+            if blocks.get(block_id) is not item.block:
+                self.scene.removeItem(self._item_by_id.pop(block_id))
+        
+        for block_id, block in blocks.items():
+            graphics_item = self._item_by_id.get(block_id)
+            if graphics_item is not None:
+                # Existing item: sync its placement and repaint in place
+                graphics_item.setPos(block.x, block.y)
+                graphics_item.setRotation(block.rotation)
+                graphics_item.update()
+                graphics_item.label_item.update()
+                continue
             graphics_item = RailGraphicsItem(block, self.railway_system)
             graphics_item.setFlag(QGraphicsItem.ItemIsMovable, False)
             graphics_item.setFlag(QGraphicsItem.ItemIsSelectable, False)
             self.scene.addItem(graphics_item)
+            self._item_by_id[block_id] = graphics_item
+        
+        # Fit the scene to the layout instead of the fixed 4000x4000 area
+        old_rect = self.scene.sceneRect()
+        if self._item_by_id:
+            self.scene.setSceneRect(self.scene.itemsBoundingRect().adjusted(-200, -200, 200, 200))
+        else:
+            self.scene.setSceneRect(-2000, -2000, 4000, 4000)
+        
+        # Redraw the cached background only when the scene rect actually moved
+        if self.scene.sceneRect() != old_rect:
+            self.scene.invalidate(self.scene.sceneRect(), QGraphicsScene.BackgroundLayer)
+        
+        # Pick the cheaper repaint strategy for the layout size
+        if len(self.railway_system.blocks) > _BOUNDING_UPDATE_THRESHOLD:
+            self.view.setViewportUpdateMode(QGraphicsView.BoundingRectViewportUpdate)
+        else:
+            self.view.setViewportUpdateMode(QGraphicsView.SmartViewportUpdate)
             
     def closeEvent(self, event):
         """Handle widget close (cleanup through controller)"""
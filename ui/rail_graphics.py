@@ -2,14 +2,203 @@
 Rail Graphics Items - QGraphicsItem implementations for different rail types
 """
 
-from PySide6.QtWidgets import QGraphicsItem, QGraphicsEllipseItem, QMenu, QGraphicsLineItem
-from PySide6.QtCore import Qt, QRectF, QPointF, QLineF
-from PySide6.QtGui import QPainter, QPen, QColor, QBrush, QPainterPath, QTransform
+from PySide6.QtWidgets import (QGraphicsItem, QGraphicsEllipseItem, QMenu, QGraphicsLineItem,
+                               QStyleOptionGraphicsItem, QGraphicsObject)
+from PySide6.QtCore import Qt, QRectF, QPointF, QLineF, QTimer
+from PySide6.QtGui import QPainter, QPen, QColor, QBrush, QPainterPath, QTransform, QFont
 
 from core.railway_system import RailBlock, RailwaySystem
+from functools import lru_cache
+from typing import Optional
 import math
 
 
+# Below this zoom level only the track itself is drawn (no labels or connection lines)
+_DETAIL_LOD = 0.5
+
+# Below this zoom level sleepers are sub-pixel, so only the rails are drawn
+_SLEEPER_LOD = 0.3
+
+# Dragged connection points snap to others within this Manhattan distance (pixels)
+_CONNECTION_THRESHOLD = 30
+
+# Connection point grid bucket size; a snap partner is always in a neighbouring cell
+_GRID_CELL = _CONNECTION_THRESHOLD
+
+# Curves and switch branches all turn through 30 degrees; curve labels sit at the 15-degree midpoint
+_COS30 = math.cos(math.radians(30))
+_SIN30 = math.sin(math.radians(30))
+_COS15 = math.cos(math.radians(15))
+_SIN15 = math.sin(math.radians(15))
+
+# Paint resources shared by every rail instead of rebuilt on each paint
+_PEN_SELECTED = QPen(QColor(0, 120, 255), 3)
+_PEN_CONN_LINE = QPen(QColor(0, 150, 0, 100), 2, Qt.DashLine)
+_PEN_LABEL = QPen(QColor(100, 100, 100), 1)
+_FONT_LABEL = QFont("Arial", 9)
+_BRUSH_POINT_CONNECTED = QBrush(QColor(0, 200, 0))
+_PEN_POINT_CONNECTED = QPen(QColor(0, 100, 0), 2)
+_BRUSH_POINT_FREE = QBrush(QColor(255, 100, 100))
+_PEN_POINT_FREE = QPen(QColor(150, 0, 0), 2)
+
+
+@lru_cache(maxsize=None)
+def _qcolor(name: str) -> QColor:
+    """Parse a color string once; block colors come from a small fixed palette"""
+    return QColor(name)
+
+
+@lru_cache(maxsize=None)
+def _rail_pen(color: str) -> QPen:
+    """Track pen for a block color"""
+    return QPen(_qcolor(color), 2)
+
+
+@lru_cache(maxsize=None)
+def _rail_geometry(rail_type: str, length: float) -> tuple[QRectF, dict]:
+    """Bounding rect and connection point positions of a rail shape, computed once"""
+    if rail_type == 'straight':
+        return QRectF(-15, -15, length + 30, 30), {'start': (0, 0), 'end': (length, 0)}
+    elif rail_type == 'curved':
+        # 30-degree curve endpoint
+        end_x = length * _COS30
+        end_y = length * _SIN30
+        return (QRectF(-15, -15, end_x + 30, end_y + 30),
+                {'start': (0, 0), 'end': (end_x, end_y)})
+    elif rail_type in ['switch_left', 'switch_right']:
+        # 30-degree diverging track, up for left switches and down for right ones
+        div_y = length * _SIN30
+        end2_y = -div_y if rail_type == 'switch_left' else div_y
+        return (QRectF(-15, -div_y - 15, length + 30, div_y * 2 + 30),
+                {'start': (0, 0), 'end1': (length, 0), 'end2': (length * _COS30, end2_y)})
+    return QRectF(-15, -15, length + 30, 30), {}
+
+
+@lru_cache(maxsize=None)
+def _rail_glyph(rail_type: str, length: float, sleepers: bool = True) -> QPainterPath:
+    """Track drawing of a rail shape (rails and sleepers) as a single path, built once"""
+    path = QPainterPath()
+    
+    if rail_type == 'straight':
+        # Two parallel lines for rails
+        path.moveTo(0, -3)
+        path.lineTo(length, -3)
+        path.moveTo(0, 3)
+        path.lineTo(length, 3)
+        
+        # Sleepers (ties)
+        if sleepers:
+            for i in range(0, int(length), 15):
+                path.moveTo(i, -5)
+                path.lineTo(i, 5)
+    elif rail_type == 'curved':
+        # 30-degree curve
+        rail_width = 6
+        end_x = length * _COS30
+        end_y = length * _SIN30
+        
+        # Control point for smooth curve
+        ctrl_x = length * 0.5
+        ctrl_y = 0
+        
+        # Outer rail, then the parallel inner rail
+        path.moveTo(0, 0)
+        path.quadTo(ctrl_x, ctrl_y, end_x, end_y)
+        path.moveTo(0, -rail_width)
+        path.quadTo(ctrl_x + rail_width * 0.5, ctrl_y + rail_width,
+                    end_x + rail_width * _SIN30, end_y - rail_width * _COS30)
+        
+        # Sleepers (ties) along the curve
+        if sleepers:
+            for i in range(0, 8):
+                t = i / 8.0
+                # Bezier curve position
+                x = 2*(1-t)*t*ctrl_x + t*t*end_x
+                y = 2*(1-t)*t*ctrl_y + t*t*end_y
+                
+                # Tangent angle
+                local_angle = math.atan2(y, x)
+                sleeper_len = 12
+                dx = math.cos(local_angle + math.pi/2) * sleeper_len
+                dy = math.sin(local_angle + math.pi/2) * sleeper_len
+                
+                path.moveTo(int(x - dx/2), int(y - dy/2))
+                path.lineTo(int(x + dx/2), int(y + dy/2))
+    elif rail_type in ['switch_left', 'switch_right']:
+        # Main track (straight)
+        path.moveTo(0, -3)
+        path.lineTo(length, -3)
+        path.moveTo(0, 3)
+        path.lineTo(length, 3)
+        
+        # Diverging track at 30 degrees, up for left switches and down for right ones
+        div_x = length * _COS30
+        div_y = length * _SIN30
+        side = -1 if rail_type == 'switch_left' else 1
+        path.moveTo(int(length * 0.2), 0)
+        path.lineTo(int(div_x), int(side * div_y))
+        path.moveTo(int(length * 0.2), 0)
+        path.lineTo(int(div_x - 6), int(side * div_y - side * 3))
+        
+    return path
+
+
+@lru_cache(maxsize=None)
+def _label_layout(rail_type: str, length: float) -> tuple[QRectF, Optional[QTransform], QRectF]:
+    """Text rect of a rail shape's ID label, the transform that rotates it if any, and its bounds"""
+    if rail_type == 'curved':
+        # Midpoint of the 30-degree arc, past its outer edge, turned to follow the curve
+        radius = length + 40
+        transform = QTransform()
+        transform.translate(radius * _COS15, radius * _SIN15)
+        transform.rotate(-15)  # Negative because Qt rotates clockwise
+        text_rect = QRectF(-40, -10, 80, 20)
+        return text_rect, transform, transform.mapRect(text_rect)
+    
+    # Centered above the track; switches sit higher to clear the diverging track
+    text_y = -35 if rail_type in ['switch_left', 'switch_right'] else -25
+    text_rect = QRectF(int(length / 2 - 40), text_y - 10, 80, 20)
+    return text_rect, None, text_rect
+
+
+def connection_grid(scene) -> dict:
+    """Spatial grid of a scene's connection points: (cell_x, cell_y) -> {(rail, point): (x, y)}"""
+    grid = getattr(scene, '_connection_grid', None)
+    if grid is None:
+        grid = scene._connection_grid = {}
+    return grid
+
+
+def rail_items(scene) -> dict:
+    """A scene's rail graphics items by block id"""
+    items = getattr(scene, '_rail_items', None)
+    if items is None:
+        items = scene._rail_items = {}
+    return items
+
+
+def connection_overlay(scene, railway_system: RailwaySystem) -> 'ConnectionOverlayItem':
+    """A scene's connection line overlay, added on first use"""
+    overlay = getattr(scene, '_connection_overlay', None)
+    if overlay is None:
+        overlay = scene._connection_overlay = ConnectionOverlayItem(railway_system)
+        scene.addItem(overlay)
+    return overlay
+
+
+def refresh_rail_labels(scene):
+    """Repaint the ID labels of a scene's rails after their BL IDs were reassigned"""
+    for rail in rail_items(scene).values():
+        rail.label_item.update()
+
+
+def clear_scene_lookups(scene):
+    """Forget a scene's rail lookups after QGraphicsScene.clear() deleted its items"""
+    connection_grid(scene).clear()
+    rail_items(scene).clear()
+    scene._connection_overlay = None
+
+
 class ConnectionPointItem(QGraphicsEllipseItem):
     """Draggable connection point"""
     
@@ -31,11 +220,11 @@ class ConnectionPointItem(QGraphicsEllipseItem):
         """Update color based on connection status"""
         is_connected = self.parent_rail.block.connections.get(self.point_name) is not None
         if is_connected:
-            self.setBrush(QBrush(QColor(0, 200, 0)))
-            self.setPen(QPen(QColor(0, 100, 0), 2))
+            self.setBrush(_BRUSH_POINT_CONNECTED)
+            self.setPen(_PEN_POINT_CONNECTED)
         else:
-            self.setBrush(QBrush(QColor(255, 100, 100)))
-            self.setPen(QPen(QColor(150, 0, 0), 2))
+            self.setBrush(_BRUSH_POINT_FREE)
+            self.setPen(_PEN_POINT_FREE)
             
     def itemChange(self, change, value):
         """Handle dragging to connect to nearby points"""
@@ -55,28 +244,33 @@ class ConnectionPointItem(QGraphicsEllipseItem):
         
     def check_for_connection(self, scene_pos: QPointF):
         """Check if dragged near another connection point"""
-        connection_threshold = 30  # pixels - increased for easier connection
-        
         scene = self.scene()
         if not scene:
             return
             
-        # Find nearby connection points
-        for item in scene.items():
-            if isinstance(item, ConnectionPointItem) and item != self:
-                distance = (item.scenePos() - scene_pos).manhattanLength()
-                
-                if distance < connection_threshold:
-                    # Connect these two points
-                    self.connect_to(item)
-                    return
+        # Find nearby connection points; only the surrounding 3x3 grid cells can hold one
+        grid = connection_grid(scene)
+        sx, sy = scene_pos.x(), scene_pos.y()
+        cell_x = int(sx // _GRID_CELL)
+        cell_y = int(sy // _GRID_CELL)
+        for gx in range(cell_x - 1, cell_x + 2):
+            for gy in range(cell_y - 1, cell_y + 2):
+                for (rail, point_name), (x, y) in grid.get((gx, gy), {}).items():
+                    if rail is not self.parent_rail or point_name != self.point_name:
+                        # Manhattan distance on the filed coordinates; no Qt calls per candidate
+                        distance = abs(x - sx) + abs(y - sy)
+                        
+                        if distance < _CONNECTION_THRESHOLD:
+                            # Connect these two points
+                            self.connect_to(rail, point_name)
+                            return
                     
-    def connect_to(self, other: 'ConnectionPointItem'):
-        """Create connection between two points"""
+    def connect_to(self, other_rail: 'RailGraphicsItem', other_point: str):
+        """Create connection between this point and another rail's point"""
         rail1_id = self.parent_rail.block.id
-        rail2_id = other.parent_rail.block.id
+        rail2_id = other_rail.block.id
         point1 = self.point_name
-        point2 = other.point_name
+        point2 = other_point
         
         # Don't connect to self
         if rail1_id == rail2_id:
@@ -89,28 +283,38 @@ class ConnectionPointItem(QGraphicsEllipseItem):
         
         if success:
             # Auto-snap: align the rails so connection points match perfectly
-            self.snap_rails_together(other)
+            self.snap_rails_together(other_rail, other_point)
             
             self.update_appearance()
-            other.update_appearance()
             self.parent_rail.update()
-            other.parent_rail.update()
+            other_rail.refresh_connection_points()
             
-    def snap_rails_together(self, other: 'ConnectionPointItem'):
+    def snap_rails_together(self, other_rail: 'RailGraphicsItem', other_point: str):
         """Snap two rails together by aligning their connection points"""
         # Get world positions of both connection points BEFORE moving
         my_world_pos = self.mapToScene(QPointF(0, 0))
-        other_world_pos = other.mapToScene(QPointF(0, 0))
+        other_x, other_y = other_rail.get_connection_point_positions()[other_point]
+        other_world_pos = other_rail.mapToScene(QPointF(other_x, other_y))
         
         # Calculate the offset needed to align the connection points
         offset = other_world_pos - my_world_pos
         
-        # Move the rail that was dragged (this rail's parent) to align perfectly
+        # Move the rail that was dragged (this rail's parent) to align, on whole pixels
         current_rail_pos = self.parent_rail.pos()
         new_rail_pos = current_rail_pos + offset
+        new_rail_pos = QPointF(round(new_rail_pos.x()), round(new_rail_pos.y()))
         
-        # Apply the position change
-        self.parent_rail.setPos(new_rail_pos)
+        # Already aligned: moving again would only repaint the same pixels
+        if (abs(current_rail_pos.x() - new_rail_pos.x()) < 0.5
+                and abs(current_rail_pos.y() - new_rail_pos.y()) < 0.5):
+            return
+            
+        # Apply the position change; the railway system is updated right below instead
+        self.parent_rail._snapping = True
+        try:
+            self.parent_rail.setPos(new_rail_pos)
+        finally:
+            self.parent_rail._snapping = False
         self.parent_rail.block.x = new_rail_pos.x()
         self.parent_rail.block.y = new_rail_pos.y()
         
@@ -121,14 +325,13 @@ class ConnectionPointItem(QGraphicsEllipseItem):
             new_rail_pos.y()
         )
         
-        # Force visual update
+        # Repaint the rail itself; setPos() already marks the old and new areas dirty
         self.parent_rail.update()
-        if self.parent_rail.scene():
-            self.parent_rail.scene().update()
             
     def mouseDoubleClickEvent(self, event):
         """Double-click to disconnect"""
         if event.button() == Qt.LeftButton:
+            peer = self.parent_rail.block.connections.get(self.point_name)
             self.parent_rail.railway_system.disconnect_blocks(
                 self.parent_rail.block.id, self.point_name
             )
@@ -136,9 +339,59 @@ class ConnectionPointItem(QGraphicsEllipseItem):
             self.parent_rail.update()
             
             # Update the connected point
-            for item in self.scene().items():
-                if isinstance(item, ConnectionPointItem):
-                    item.update_appearance()
+            if peer:
+                peer_rail = rail_items(self.scene()).get(peer[0])
+                if peer_rail:
+                    peer_rail.refresh_connection_points()
+
+
+class RailLabelItem(QGraphicsItem):
+    """ID label of a rail, painted and cached apart from the track"""
+    
+    def __init__(self, rail: 'RailGraphicsItem'):
+        super().__init__(rail)
+        self.block = rail.block
+        
+        # Clicks and drags go through to the rail underneath
+        self.setAcceptedMouseButtons(Qt.NoButton)
+        
+        # The text only changes when the blocks are renumbered; views then call
+        # refresh_rail_labels() on block_ids_changed, which drops this pixmap
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+        
+    def boundingRect(self) -> QRectF:
+        """Return bounding rectangle of the label"""
+        return _label_layout(self.block.type, self.block.length)[2]
+        
+    def shape(self) -> QPainterPath:
+        """Return an empty shape; the label is drawn but not hit-tested"""
+        return QPainterPath()
+        
+    def paint(self, painter: QPainter, option, widget):
+        """Paint the block ID label on the rail"""
+        # Skip the text when zoomed out too far for it to be legible
+        if QStyleOptionGraphicsItem.levelOfDetailFromTransform(painter.worldTransform()) < _DETAIL_LOD:
+            return
+            
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        
+        # Set font for ID label
+        painter.setFont(_FONT_LABEL)
+        
+        # Set text color to gray
+        painter.setPen(_PEN_LABEL)
+        
+        # Get the block ID (BL001001) if available, otherwise use rail ID
+        display_id = getattr(self.block, 'block_id', self.block.id)
+        
+        # Draw the label where the rail shape puts it (cached per shape)
+        text_rect, transform, _ = _label_layout(self.block.type, self.block.length)
+        if transform is not None:
+            painter.setTransform(transform, True)
+        painter.drawText(text_rect, Qt.AlignCenter, display_id)
+        
+        painter.restore()
 
 
 class RailGraphicsItem(QGraphicsItem):
@@ -149,35 +402,46 @@ class RailGraphicsItem(QGraphicsItem):
         self.block = block
         self.railway_system = railway_system
         
+        # Draggable connection point items, only present while the rail is hovered
+        self.connection_items = []
+        # Grid this rail's points are filed in, and their cells; itemChange may run first
+        self._grid: Optional[dict] = None
+        self._grid_cells: list[tuple[tuple[int, int], str]] = []
+        # Set while a moved position waits to be reported to the railway system
+        self._pending_persist = False
+        # Set while snap_rails_together moves the rail and reports the position itself
+        self._snapping = False
+        # Connection points painted as connected, to spot model-side connection changes
+        self._connected = self._connected_points()
+        
         # Make item movable and selectable
         self.setFlag(QGraphicsItem.ItemIsMovable, True)
         self.setFlag(QGraphicsItem.ItemIsSelectable, True)
         self.setFlag(QGraphicsItem.ItemSendsGeometryChanges, True)
+        # Hovering swaps the painted connection points for draggable ones
+        self.setAcceptHoverEvents(True)
+        
+        # Keep the rendered rail as a pixmap; panning blits it instead of calling paint()
+        # The pixmap is not invalidated when block data changes outside itemChange, so
+        # whoever changes displayed data must repaint the item:
+        # - color: the views on block_color(s)_changed (MonitorView._flush_dirty, EditorView)
+        # - connections: ConnectionPointItem after a drag or double-click, and EditorView
+        #   on block_updated through sync_connection_state() (e.g. a neighbour deleted)
+        # - BL IDs (label child): the views on block_ids_changed via refresh_rail_labels()
+        # Position and rotation only change the item transform and need no repaint
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
         
         # Set position and rotation
         self.setPos(block.x, block.y)
         self.setRotation(block.rotation)
         
-        # Connection points (visual indicators)
-        self.connection_items = []
-        self.create_connection_points()
+        # The ID label is a child with its own cache, so recoloring the rail keeps the text pixmap
+        self.label_item = RailLabelItem(self)
         
     def boundingRect(self) -> QRectF:
         """Return bounding rectangle for the item"""
-        length = self.block.length
-        if self.block.type == 'straight':
-            return QRectF(-15, -15, length + 30, 30)
-        elif self.block.type == 'curved':
-            # 30-degree curve bounding box
-            angle_rad = math.radians(30)
-            end_x = length * math.cos(angle_rad)
-            end_y = length * math.sin(angle_rad)
-            return QRectF(-15, -15, end_x + 30, end_y + 30)
-        elif self.block.type in ['switch_left', 'switch_right']:
-            angle_rad = math.radians(30)
-            div_y = length * math.sin(angle_rad)
-            return QRectF(-15, -div_y - 15, length + 30, div_y * 2 + 30)
-        return QRectF(-15, -15, length + 30, 30)
+        # Qt asks for this far more often than it paints; the shape is cached
+        return _rail_geometry(self.block.type, self.block.length)[0]
         
     def paint(self, painter: QPainter, option, widget):
         """Paint the rail block"""
@@ -185,279 +449,157 @@ class RailGraphicsItem(QGraphicsItem):
         
         # Set color based on selection and block color
         if self.isSelected():
-            pen = QPen(QColor(0, 120, 255), 3)
+            pen = _PEN_SELECTED
         else:
-            pen = QPen(QColor(self.block.color), 2)
+            pen = _rail_pen(self.block.color)
             
         painter.setPen(pen)
+        # Views may skip saving painter state, so don't inherit another item's brush
+        painter.setBrush(Qt.NoBrush)
         
-        # Draw based on type
-        if self.block.type == 'straight':
-            self.paint_straight(painter)
-        elif self.block.type == 'curved':
-            self.paint_curved(painter)
-        elif self.block.type == 'switch_left':
-            self.paint_switch_left(painter)
-        elif self.block.type == 'switch_right':
-            self.paint_switch_right(painter)
+        # Draw the track (rails and sleepers) in one call from the cached glyph
+        lod = QStyleOptionGraphicsItem.levelOfDetailFromTransform(painter.worldTransform())
+        painter.drawPath(_rail_glyph(self.block.type, self.block.length, lod >= _SLEEPER_LOD))
             
-        # Draw connection lines to connected blocks
-        self.draw_connection_lines(painter)
+        # Skip the fine detail when zoomed out too far for it to be legible
+        if lod < _DETAIL_LOD:
+            return
             
         # Draw connection points
         self.paint_connection_points(painter)
         
-        # Draw rail ID label
-        self.paint_rail_id(painter)
-        
-    def draw_connection_lines(self, painter: QPainter):
-        """Draw visual lines showing connections between rails"""
-        painter.save()
-        painter.setPen(QPen(QColor(0, 150, 0, 100), 2, Qt.DashLine))
-        
-        points = self.get_connection_point_positions()
-        for point_name, (x, y) in points.items():
-            conn = self.block.connections.get(point_name)
-            if conn:
-                conn_block_id, conn_point_name = conn
-                conn_block = self.railway_system.blocks.get(conn_block_id)
-                if conn_block:
-                    # Calculate world position of this connection point
-                    local_pos = QPointF(x, y)
-                    world_pos = self.mapToScene(local_pos)
-                    
-                    # Calculate world position of connected point
-                    # Find the graphics item for the connected block
-                    for item in self.scene().items():
-                        if isinstance(item, RailGraphicsItem) and item.block.id == conn_block_id:
-                            conn_points = item.get_connection_point_positions()
-                            if conn_point_name in conn_points:
-                                conn_x, conn_y = conn_points[conn_point_name]
-                                conn_world_pos = item.mapToScene(QPointF(conn_x, conn_y))
-                                
-                                # Draw line in scene coordinates
-                                line_start = self.mapFromScene(world_pos)
-                                line_end = self.mapFromScene(conn_world_pos)
-                                painter.drawLine(line_start, line_end)
-                            break
-        
-        painter.restore()
-        
-    def paint_straight(self, painter: QPainter):
-        """Paint a straight rail"""
-        length = self.block.length
-        
-        # Draw two parallel lines for rails
-        painter.drawLine(0, -3, length, -3)
-        painter.drawLine(0, 3, length, 3)
-        
-        # Draw sleepers (ties)
-        for i in range(0, int(length), 15):
-            painter.drawLine(i, -5, i, 5)
-            
-    def paint_curved(self, painter: QPainter):
-        """Paint a curved rail (30-degree curve)"""
-        length = self.block.length
-        rail_width = 6
-        
-        # 30-degree curve
-        angle_rad = math.radians(30)
-        end_x = length * math.cos(angle_rad)
-        end_y = length * math.sin(angle_rad)
-        
-        # Control point for smooth curve
-        ctrl_x = length * 0.5
-        ctrl_y = 0
-        
-        # Draw outer rail (curved)
-        path_outer = QPainterPath()
-        path_outer.moveTo(0, 0)
-        path_outer.quadTo(ctrl_x, ctrl_y, end_x, end_y)
-        
-        # Draw inner rail (curved, parallel)
-        path_inner = QPainterPath()
-        path_inner.moveTo(rail_width * math.sin(0), -rail_width * math.cos(0))
-        path_inner.quadTo(ctrl_x + rail_width * 0.5, ctrl_y + rail_width, 
-                         end_x + rail_width * math.sin(angle_rad), 
-                         end_y - rail_width * math.cos(angle_rad))
-        
-        painter.drawPath(path_outer)
-        painter.drawPath(path_inner)
-        
-        # Draw sleepers (ties) along the curve
-        for i in range(0, 8):
-            t = i / 8.0
-            # Bezier curve position
-            x = (1-t)*(1-t)*0 + 2*(1-t)*t*ctrl_x + t*t*end_x
-            y = (1-t)*(1-t)*0 + 2*(1-t)*t*ctrl_y + t*t*end_y
-            
-            # Tangent angle
-            local_angle = math.atan2(y, x)
-            sleeper_len = 12
-            dx = math.cos(local_angle + math.pi/2) * sleeper_len
-            dy = math.sin(local_angle + math.pi/2) * sleeper_len
-            
-            painter.drawLine(int(x - dx/2), int(y - dy/2), 
-                           int(x + dx/2), int(y + dy/2))
-        
-    def paint_switch_left(self, painter: QPainter):
-        """Paint a left switch rail (30-degree diverging)"""
-        length = self.block.length
-        angle_rad = math.radians(30)
-        
-        # Main track (straight)
-        painter.drawLine(0, -3, length, -3)
-        painter.drawLine(0, 3, length, 3)
-        
-        # Diverging track (to the left/up at 30 degrees)
-        div_x = length * math.cos(angle_rad)
-        div_y = -length * math.sin(angle_rad)
-        painter.drawLine(int(length * 0.2), 0, int(div_x), int(div_y))
-        painter.drawLine(int(length * 0.2), 0, int(div_x - 6), int(div_y + 3))
-        
-    def paint_switch_right(self, painter: QPainter):
-        """Paint a right switch rail (30-degree diverging)"""
-        length = self.block.length
-        angle_rad = math.radians(30)
-        
-        # Main track (straight)
-        painter.drawLine(0, -3, length, -3)
-        painter.drawLine(0, 3, length, 3)
-        
-        # Diverging track (to the right/down at 30 degrees)
-        div_x = length * math.cos(angle_rad)
-        div_y = length * math.sin(angle_rad)
-        painter.drawLine(int(length * 0.2), 0, int(div_x), int(div_y))
-        painter.drawLine(int(length * 0.2), 0, int(div_x - 6), int(div_y - 3))
-        
     def paint_connection_points(self, painter: QPainter):
         """Paint connection point indicators"""
-        # Connection points are now drawn as separate items
-        pass
-        
-    def paint_rail_id(self, painter: QPainter):
-        """Paint the block ID label on the rail"""
-        from PySide6.QtGui import QFont
-        
-        painter.save()
-        
-        # Set font for ID label
-        font = QFont("Arial", 9)
-        painter.setFont(font)
-        
-        # Set text color to gray
-        painter.setPen(QPen(QColor(100, 100, 100), 1))
-        
-        # Get the block ID (BL001001) if available, otherwise use rail ID
-        display_id = getattr(self.block, 'block_id', self.block.id)
-        
-        # Calculate position for text - further from the rail for visibility
-        length = self.block.length
-        
-        if self.block.type == 'straight':
-            # Center of straight rail, further above
-            text_x = length / 2
-            text_y = -25  # Further above the rail
-            text_rotation = 0
-        elif self.block.type == 'curved':
-            # For curved rail: position at midpoint of the 30-degree arc
-            # and rotate text to match the curve orientation
-            angle_rad = math.radians(15)  # Midpoint of 30-degree curve
-            
-            # Position at the outer edge of the curve, further away
-            radius_offset = 40  # Distance from the curve
-            text_x = (length + radius_offset) * math.cos(angle_rad)
-            text_y = (length + radius_offset) * math.sin(angle_rad)
+        # While hovered, the draggable point items draw themselves
+        if self.connection_items:
+            return
             
-            # Rotate text to align with curve tangent at midpoint
-            text_rotation = 15  # Degrees
-        elif self.block.type in ['switch_left', 'switch_right']:
-            # For switches: position above and to the side to avoid both tracks
-            # The switch has a straight track and a diverging track at 30 degrees
-            text_x = length / 2
-            if self.block.type == 'switch_left':
-                # Position to the right (away from left diverging track)
-                text_y = -35
-            else:  # switch_right
-                # Position to the right (away from right diverging track)
-                text_y = -35
-            text_rotation = 0
-        else:
-            text_x = length / 2
-            text_y = -25
-            text_rotation = 0
-        
-        # Apply rotation if needed (for curved rails)
-        if text_rotation != 0:
-            painter.save()
-            painter.translate(text_x, text_y)
-            painter.rotate(-text_rotation)  # Negative because Qt rotates clockwise
-            painter.drawText(-40, -10, 80, 20, Qt.AlignCenter, display_id)
-            painter.restore()
-        else:
-            # Draw the block ID with larger text area (no rotation)
-            painter.drawText(int(text_x - 40), int(text_y - 10), 80, 20, 
-                            Qt.AlignCenter, display_id)
+        connections = self.block.connections
+        for point_name, (x, y) in self.get_connection_point_positions().items():
+            if connections.get(point_name) is not None:
+                painter.setBrush(_BRUSH_POINT_CONNECTED)
+                painter.setPen(_PEN_POINT_CONNECTED)
+            else:
+                painter.setBrush(_BRUSH_POINT_FREE)
+                painter.setPen(_PEN_POINT_FREE)
+            painter.drawEllipse(QPointF(x, y), 6, 6)
         
-        painter.restore()
-            
     def get_connection_point_positions(self) -> dict:
-        """Get positions of connection points in item coordinates"""
-        points = {}
-        length = self.block.length
-        
-        if self.block.type == 'straight':
-            points['start'] = (0, 0)
-            points['end'] = (length, 0)
-        elif self.block.type == 'curved':
-            # 30-degree curve endpoint
-            angle_rad = math.radians(30)
-            end_x = length * math.cos(angle_rad)
-            end_y = length * math.sin(angle_rad)
-            points['start'] = (0, 0)
-            points['end'] = (end_x, end_y)
-        elif self.block.type in ['switch_left', 'switch_right']:
-            points['start'] = (0, 0)
-            points['end1'] = (length, 0)
-            if self.block.type == 'switch_left':
-                # 30-degree diverging track
-                angle_rad = math.radians(30)
-                points['end2'] = (length * math.cos(angle_rad), -length * math.sin(angle_rad))
-            else:
-                angle_rad = math.radians(30)
-                points['end2'] = (length * math.cos(angle_rad), length * math.sin(angle_rad))
-                
-        return points
+        """Get positions of connection points in item coordinates (shared; don't modify)"""
+        return _rail_geometry(self.block.type, self.block.length)[1]
         
     def create_connection_points(self):
         """Create visual connection point items"""
         # Clear existing connection items
-        for item in self.connection_items:
-            if item.scene():
-                item.scene().removeItem(item)
-        self.connection_items.clear()
+        self.remove_connection_points()
         
         # Create new connection point items
         points = self.get_connection_point_positions()
         for point_name, (x, y) in points.items():
             conn_item = ConnectionPointItem(self, point_name, x, y)
             self.connection_items.append(conn_item)
+        self.update()
+        
+    def remove_connection_points(self):
+        """Drop the draggable connection point items; paint() draws the points again"""
+        for item in self.connection_items:
+            if item.scene():
+                item.scene().removeItem(item)
+        self.connection_items.clear()
+        self.update()
+        
+    def _connected_points(self) -> frozenset:
+        """Names of this rail's connection points that are connected"""
+        return frozenset(name for name, conn in self.block.connections.items() if conn is not None)
+        
+    def sync_connection_state(self):
+        """Repaint the connection points if the model changed them behind this item"""
+        connected = self._connected_points()
+        if connected != self._connected:
+            self._connected = connected
+            self.refresh_connection_points()
+            
+    def refresh_connection_points(self):
+        """Repaint the connection points after their connection status changed"""
+        for item in self.connection_items:
+            item.update_appearance()
+        self.update()
+        
+    def hoverEnterEvent(self, event):
+        """Show draggable connection points while the pointer is over an editable rail"""
+        if self.flags() & QGraphicsItem.ItemIsMovable and not self.connection_items:
+            self.create_connection_points()
+        super().hoverEnterEvent(event)
+        
+    def hoverLeaveEvent(self, event):
+        """Go back to painted connection points"""
+        if self.connection_items:
+            self.remove_connection_points()
+        super().hoverLeaveEvent(event)
+        
+    def update_grid_cells(self):
+        """Re-file this rail's connection points in its scene's grid after it moved"""
+        for cell, point_name in self._grid_cells:
+            bucket = self._grid[cell]
+            del bucket[(self, point_name)]
+            if not bucket:
+                del self._grid[cell]
+        self._grid = None
+        self._grid_cells = []
+        
+        scene = self.scene()
+        if scene:
+            self._grid = connection_grid(scene)
+            for point_name, (x, y) in self.get_connection_point_positions().items():
+                pos = self.mapToScene(x, y)
+                x, y = pos.x(), pos.y()
+                cell = (int(x // _GRID_CELL), int(y // _GRID_CELL))
+                self._grid.setdefault(cell, {})[(self, point_name)] = (x, y)
+                self._grid_cells.append((cell, point_name))
         
     def itemChange(self, change, value):
         """Handle item changes (e.g., position)"""
         if change == QGraphicsItem.ItemPositionHasChanged:
-            # Update block position in railway system
+            # Keep the block in step; report user moves once per event-loop pass. Syncing
+            # from the block (construction, monitor refresh) leaves it unchanged, and
+            # non-movable rails are read-only views, so neither writes to the model
             pos = self.pos()
-            self.railway_system.update_block_position(self.block.id, pos.x(), pos.y())
+            moved = (pos.x(), pos.y()) != (self.block.x, self.block.y)
             self.block.x = pos.x()
             self.block.y = pos.y()
-        elif change == QGraphicsItem.ItemPositionChange:
-            # Force scene update to prevent visual artifacts
-            if self.scene():
-                self.scene().update()
+            if (moved and self.flags() & QGraphicsItem.ItemIsMovable
+                    and not self._pending_persist and not self._snapping):
+                self._pending_persist = True
+                QTimer.singleShot(0, self._flush_persist)
+            
+            # Keep the connection point grid in step with the rail
+            self.update_grid_cells()
+        elif change == QGraphicsItem.ItemRotationHasChanged:
+            self.update_grid_cells()
+        elif change == QGraphicsItem.ItemSceneChange:
+            # Leaving the current scene: drop it from that scene's lookup and lines
+            scene = self.scene()
+            if scene and rail_items(scene).get(self.block.id) is self:
+                del rail_items(scene)[self.block.id]
+                connection_overlay(scene, self.railway_system).schedule_rebuild()
+        elif change == QGraphicsItem.ItemSceneHasChanged:
+            # Added to or removed from a scene
+            self.update_grid_cells()
+            scene = self.scene()
+            if scene:
+                rail_items(scene)[self.block.id] = self
+                connection_overlay(scene, self.railway_system).schedule_rebuild()
             
         return super().itemChange(change, value)
         
+    def _flush_persist(self):
+        """Report the rail's final position of a drag step to the railway system"""
+        self._pending_persist = False
+        
+        # The block may have been removed or the layout reloaded in the meantime
+        if self.railway_system.blocks.get(self.block.id) is self.block:
+            self.railway_system.update_block_position(self.block.id, self.block.x, self.block.y)
+            
     def contextMenuEvent(self, event):
         """Show context menu on right click"""
         menu = QMenu()
@@ -501,3 +643,86 @@ class RailGraphicsItem(QGraphicsItem):
         elif action == delete_action:
             self.railway_system.remove_block(self.block.id)
 
+
+class ConnectionOverlayItem(QGraphicsObject):
+    """Draws the dashed lines between connected rails of a scene in one pass"""
+    
+    def __init__(self, railway_system: RailwaySystem):
+        super().__init__()
+        self.railway_system = railway_system
+        self._lines: list[QLineF] = []
+        self._bounds = QRectF()
+        self._rebuild_pending = False
+        
+        # Under the rails, and never the target of clicks
+        self.setZValue(-1)
+        self.setAcceptedMouseButtons(Qt.NoButton)
+        
+        # Connections and rail positions change through the model
+        railway_system.block_updated.connect(self.schedule_rebuild)
+        railway_system.block_removed.connect(self.schedule_rebuild)
+        
+    def boundingRect(self) -> QRectF:
+        """Return bounding rectangle of all connection lines"""
+        return self._bounds
+    
+    def shape(self) -> QPainterPath:
+        """Empty shape so hit tests (e.g. itemAt) pass through to the scene"""
+        return QPainterPath()
+    
+    def schedule_rebuild(self, *args):
+        """Rebuild the lines once control returns to the event loop"""
+        # Drags and layout loads change many blocks in a row; rebuild once for all of them
+        if not self._rebuild_pending:
+            self._rebuild_pending = True
+            QTimer.singleShot(0, self, self.rebuild)
+            
+    def rebuild(self):
+        """Recompute every connection line in scene coordinates"""
+        self._rebuild_pending = False
+        scene = self.scene()
+        if not scene:
+            return
+            
+        items = rail_items(scene)
+        lines = []
+        seen = set()
+        for block_id, item in items.items():
+            points = item.get_connection_point_positions()
+            for point_name, conn in item.block.connections.items():
+                if not conn or point_name not in points:
+                    continue
+                    
+                # Both ends list the connection; draw it once
+                key = tuple(sorted([(block_id, point_name), tuple(conn)]))
+                if key in seen:
+                    continue
+                seen.add(key)
+                
+                peer = items.get(conn[0])
+                if peer:
+                    peer_points = peer.get_connection_point_positions()
+                    if conn[1] in peer_points:
+                        x, y = points[point_name]
+                        conn_x, conn_y = peer_points[conn[1]]
+                        lines.append(QLineF(item.mapToScene(x, y), peer.mapToScene(conn_x, conn_y)))
+        
+        # Bounds grow with the lines; tell the scene before they change
+        bounds = QRectF()
+        for line in lines:
+            bounds = bounds.united(QRectF(line.p1(), line.p2()).normalized())
+        self.prepareGeometryChange()
+        self._lines = lines
+        self._bounds = bounds.adjusted(-2, -2, 2, 2) if lines else QRectF()
+        self.update()
+        
+    def paint(self, painter: QPainter, option, widget):
+        """Paint all connection lines with a single drawLines() call"""
+        # Same zoom cut-off as the rails' own details
+        if not self._lines or QStyleOptionGraphicsItem.levelOfDetailFromTransform(
+                painter.worldTransform()) < _DETAIL_LOD:
+            return
+            
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(_PEN_CONN_LINE)
+        painter.drawLines(self._lines)
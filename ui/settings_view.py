@@ -1,11 +1,132 @@
 """
 Settings view - Modern application settings and preferences
 """
+from contextlib import contextmanager
+from functools import partial
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-                               QPushButton, QColorDialog, QSpinBox, QGroupBox,
-                               QFormLayout, QScrollArea, QLineEdit, QFrame, QMessageBox)
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QFont, QColor
+                               QPushButton, QSpinBox, QFormLayout, QScrollArea,
+                               QLineEdit, QFrame)
+from PySide6.QtCore import Qt, Signal, QTimer
+from PySide6.QtGui import QColor
+from ui.styles import FONT_PAGE_HEADER, FONT_CARD_TITLE
+
+
+# One stylesheet for the whole view; widgets are matched by object name
+_SETTINGS_QSS = """
+    QWidget {
+        background-color: #F3F4F6;
+    }
+    QFrame#settingsHeader, QFrame#settingsHeader QFrame,
+    QFrame#settingsCard, QFrame#settingsCard QFrame {
+        background-color: #FFFFFF;
+        border-radius: 12px;
+        padding: 20px;
+    }
+    QFrame#settingsButtonBar {
+        background-color: #FFFFFF;
+        border-radius: 12px;
+        padding: 15px;
+    }
+    QScrollArea {
+        border: none;
+        background-color: transparent;
+    }
+    QLabel#settingsTitle {
+        color: #1F2937;
+    }
+    QLabel#formLabel {
+        color: #374151;
+        font-weight: 600;
+        font-size: 12px;
+    }
+    QFrame#settingsCard QLabel#settingsHint {
+        color: #2563EB;
+        font-size: 11px;
+        font-style: italic;
+        padding: 10px;
+        background-color: #DBEAFE;
+        border-radius: 6px;
+    }
+    QLineEdit, QSpinBox {
+        background-color: #F9FAFB;
+        border: 2px solid #E5E7EB;
+        border-radius: 6px;
+        padding: 8px 12px;
+        color: #1F2937;
+        font-size: 12px;
+    }
+    QLineEdit:focus, QSpinBox:focus {
+        border-color: #3B82F6;
+        background-color: #FFFFFF;
+    }
+    QPushButton#btnSecondary {
+        background-color: #F3F4F6;
+        color: #374151;
+        border: 2px solid #E5E7EB;
+        padding: 12px 24px;
+        font-size: 13px;
+        font-weight: 600;
+        border-radius: 8px;
+    }
+    QPushButton#btnSecondary:hover {
+        background-color: #E5E7EB;
+        border-color: #D1D5DB;
+    }
+    QPushButton#btnPrimary {
+        background-color: #10B981;
+        color: white;
+        border: none;
+        padding: 12px 30px;
+        font-size: 14px;
+        font-weight: 600;
+        border-radius: 8px;
+    }
+    QPushButton#btnPrimary:hover {
+        background-color: #059669;
+    }
+    QPushButton#btnPrimary:pressed {
+        background-color: #047857;
+    }
+    QLabel#settingsToast {
+        background-color: #1F2937;
+        color: #FFFFFF;
+        padding: 10px 18px;
+        border-radius: 8px;
+        font-size: 13px;
+        font-weight: 600;
+    }
+"""
+
+# Quiet period before typed text is stored as a temporary setting
+_TEXT_DEBOUNCE_MS = 150
+
+# How long a confirmation toast stays up
+_TOAST_MS = 1500
+
+# Color swatch button template; the background is the swatch's color
+_SWATCH_QSS = """
+    QPushButton {{
+        background-color: {color};
+        border: 2px solid #E5E7EB;
+        border-radius: 6px;
+    }}
+    QPushButton:hover {{
+        border: 2px solid #3B82F6;
+    }}
+"""
+
+
+@contextmanager
+def _signals_blocked(widgets):
+    """Block the signals of some widgets for the duration of a with-block"""
+    widgets = list(widgets)
+    for widget in widgets:
+        widget.blockSignals(True)
+    try:
+        yield
+    finally:
+        for widget in widgets:
+            widget.blockSignals(False)
 
 
 class SettingsView(QWidget):
@@ -14,6 +135,19 @@ class SettingsView(QWidget):
     # Signals
     settings_changed = Signal(dict)
     
+    # Color swatch stylesheets by hex color, shared by every settings view
+    _COLOR_BTN_SS_CACHE: dict[str, str] = {}
+    
+    # Input fields by widget type, for refreshing them from settings
+    _SPIN_KEYS = ('grid_size', 'snap_distance', 'tcp_port')
+    _TEXT_KEYS = ('tcp_bind_address',)
+    
+    # Editor spin boxes: (setting key, label, minimum, maximum, default)
+    _EDITOR_SPINS = (
+        ('grid_size', "Grid Spacing:", 10, 50, 20),
+        ('snap_distance', "Snap Distance:", 10, 100, 30),
+    )
+    
     def __init__(self, settings_controller=None, parent=None):
         super().__init__(parent)
         
@@ -34,12 +168,22 @@ class SettingsView(QWidget):
                 'tcp_bind_address': '0.0.0.0',
             }
         
-        # Temporary settings (for preview before applying)
+        # Temporary settings (for preview before applying), and whether they were edited
         self.temp_settings = self.settings.copy()
+        self._dirty = False
         
         # Store color buttons and input fields for updates
         self.color_buttons = {}
         self.input_fields = {}
+        # QColor shown by each swatch's picker, by setting key
+        self._qcolor_cache: dict[str, QColor] = {}
+        
+        # Typed text is stored once the user pauses, not on every keystroke
+        self._pending = {}
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(_TEXT_DEBOUNCE_MS)
+        self._debounce.timeout.connect(self._flush_pending)
         
         self.init_ui()
         
@@ -51,18 +195,12 @@ class SettingsView(QWidget):
         
         # Header
         header = QFrame()
-        header.setStyleSheet("""
-            QFrame {
-                background-color: #FFFFFF;
-                border-radius: 12px;
-                padding: 20px;
-            }
-        """)
+        header.setObjectName("settingsHeader")
         header_layout = QVBoxLayout(header)
         
         title = QLabel("⚙️  Settings & Configuration")
-        title.setFont(QFont("Arial", 24, QFont.Bold))
-        title.setStyleSheet("color: #1F2937;")
+        title.setFont(FONT_PAGE_HEADER)
+        title.setObjectName("settingsTitle")
         header_layout.addWidget(title)
         
         # subtitle = QLabel("Configure application preferences and network settings")
@@ -75,12 +213,6 @@ class SettingsView(QWidget):
         # Scrollable area for settings
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background-color: transparent;
-            }
-        """)
         
         scroll_content = QWidget()
         scroll_layout = QVBoxLayout(scroll_content)
@@ -104,99 +236,53 @@ class SettingsView(QWidget):
         
         # Action Buttons
         button_frame = QFrame()
-        button_frame.setStyleSheet("""
-            QFrame {
-                background-color: #FFFFFF;
-                border-radius: 12px;
-                padding: 15px;
-            }
-        """)
+        button_frame.setObjectName("settingsButtonBar")
         button_layout = QHBoxLayout(button_frame)
         
         reset_btn = QPushButton("↻ Reset to Defaults")
-        reset_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #F3F4F6;
-                color: #374151;
-                border: 2px solid #E5E7EB;
-                padding: 12px 24px;
-                font-size: 13px;
-                font-weight: 600;
-                border-radius: 8px;
-            }
-            QPushButton:hover {
-                background-color: #E5E7EB;
-                border-color: #D1D5DB;
-            }
-        """)
+        reset_btn.setObjectName("btnSecondary")
         reset_btn.clicked.connect(self.reset_to_defaults)
         button_layout.addWidget(reset_btn)
         
         button_layout.addStretch()
         
         cancel_btn = QPushButton("✕ Cancel")
-        cancel_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #F3F4F6;
-                color: #374151;
-                border: 2px solid #E5E7EB;
-                padding: 12px 24px;
-                font-size: 13px;
-                font-weight: 600;
-                border-radius: 8px;
-            }
-            QPushButton:hover {
-                background-color: #E5E7EB;
-                border-color: #D1D5DB;
-            }
-        """)
+        cancel_btn.setObjectName("btnSecondary")
         cancel_btn.clicked.connect(self.cancel_changes)
         button_layout.addWidget(cancel_btn)
         
         apply_btn = QPushButton("✓ Apply Changes")
-        apply_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #10B981;
-                color: white;
-                border: none;
-                padding: 12px 30px;
-                font-size: 14px;
-                font-weight: 600;
-                border-radius: 8px;
-            }
-            QPushButton:hover {
-                background-color: #059669;
-            }
-            QPushButton:pressed {
-                background-color: #047857;
-            }
-        """)
+        apply_btn.setObjectName("btnPrimary")
         apply_btn.clicked.connect(self.apply_changes)
         button_layout.addWidget(apply_btn)
         
         main_layout.addWidget(button_frame)
+        self._button_bar = button_frame
         
         self.setLayout(main_layout)
-        self.setStyleSheet("QWidget { background-color: #F3F4F6; }")
+        self.setStyleSheet(_SETTINGS_QSS)
+        
+        # Confirmation toast, floating above the action buttons; reused for every message
+        self._toast = QLabel(self)
+        self._toast.setObjectName("settingsToast")
+        self._toast.hide()
+        self._toast_timer = QTimer(self)
+        self._toast_timer.setSingleShot(True)
+        self._toast_timer.setInterval(_TOAST_MS)
+        self._toast_timer.timeout.connect(self._toast.hide)
         
     def create_card_group(self, title: str, icon: str = "") -> tuple:
         """Create a styled card group box"""
         card = QFrame()
-        card.setStyleSheet("""
-            QFrame {
-                background-color: #FFFFFF;
-                border-radius: 12px;
-                padding: 20px;
-            }
-        """)
+        card.setObjectName("settingsCard")
         
         main_layout = QVBoxLayout(card)
         main_layout.setSpacing(15)
         
         # Title
         title_label = QLabel(f"{icon} {title}" if icon else title)
-        title_label.setFont(QFont("Arial", 15, QFont.Bold))
-        title_label.setStyleSheet("color: #1F2937;")
+        title_label.setFont(FONT_CARD_TITLE)
+        title_label.setObjectName("settingsTitle")
         main_layout.addWidget(title_label)
         
         # Form layout for content
@@ -237,25 +323,10 @@ class SettingsView(QWidget):
         """Create editor settings group"""
         card, main_layout, form_layout = self.create_card_group("Editor Settings", "✏️")
         
-        # Grid Size
-        grid_spin = QSpinBox()
-        grid_spin.setRange(10, 50)
-        grid_spin.setValue(self.temp_settings['grid_size'])
-        grid_spin.setSuffix(" px")
-        grid_spin.setStyleSheet(self.get_input_style())
-        grid_spin.valueChanged.connect(lambda v: self.update_temp_setting('grid_size', v))
-        form_layout.addRow(self.create_label("Grid Spacing:"), grid_spin)
-        self.input_fields['grid_size'] = grid_spin
-        
-        # Snap Distance
-        snap_spin = QSpinBox()
-        snap_spin.setRange(10, 100)
-        snap_spin.setValue(self.temp_settings['snap_distance'])
-        snap_spin.setSuffix(" px")
-        snap_spin.setStyleSheet(self.get_input_style())
-        snap_spin.valueChanged.connect(lambda v: self.update_temp_setting('snap_distance', v))
-        form_layout.addRow(self.create_label("Snap Distance:"), snap_spin)
-        self.input_fields['snap_distance'] = snap_spin
+        # Grid size and snap distance
+        for key, label, minimum, maximum, default in self._EDITOR_SPINS:
+            spin = self.create_spin_box(key, minimum, maximum, default, " px")
+            form_layout.addRow(self.create_label(label), spin)
         
         main_layout.addLayout(form_layout)
         return card
@@ -265,20 +336,14 @@ class SettingsView(QWidget):
         card, main_layout, form_layout = self.create_card_group("Network Configuration", "🌐")
         
         # TCP Port
-        tcp_port_spin = QSpinBox()
-        tcp_port_spin.setRange(1024, 65535)
-        tcp_port_spin.setValue(self.temp_settings.get('tcp_port', 5555))
-        tcp_port_spin.setStyleSheet(self.get_input_style())
-        tcp_port_spin.valueChanged.connect(lambda v: self.update_temp_setting('tcp_port', v))
+        tcp_port_spin = self.create_spin_box('tcp_port', 1024, 65535, 5555)
         form_layout.addRow(self.create_label("TCP Port:"), tcp_port_spin)
-        self.input_fields['tcp_port'] = tcp_port_spin
         
         # TCP Bind Address
         tcp_bind_input = QLineEdit()
         tcp_bind_input.setText(self.temp_settings.get('tcp_bind_address', '0.0.0.0'))
         tcp_bind_input.setPlaceholderText("0.0.0.0 (all interfaces)")
-        tcp_bind_input.setStyleSheet(self.get_input_style())
-        tcp_bind_input.textChanged.connect(lambda v: self.update_temp_setting('tcp_bind_address', v))
+        tcp_bind_input.textChanged.connect(partial(self._queue_update, 'tcp_bind_address'))
         form_layout.addRow(self.create_label("Bind Address:"), tcp_bind_input)
         self.input_fields['tcp_bind_address'] = tcp_bind_input
         
@@ -286,8 +351,7 @@ class SettingsView(QWidget):
             "💡 TCP server settings for receiving railway block status updates from Docker containers. "
             "Use 0.0.0.0 to accept connections from any IP, or specify a specific interface."
         )
-        hint.setStyleSheet("color: #2563EB; font-size: 11px; font-style: italic; padding: 10px; "
-                          "background-color: #DBEAFE; border-radius: 6px;")
+        hint.setObjectName("settingsHint")
         hint.setWordWrap(True)
         main_layout.addWidget(hint)
         
@@ -297,114 +361,141 @@ class SettingsView(QWidget):
     def create_label(self, text: str) -> QLabel:
         """Create a styled form label"""
         label = QLabel(text)
-        label.setStyleSheet("color: #374151; font-weight: 600; font-size: 12px;")
+        label.setObjectName("formLabel")
         return label
         
-    def get_input_style(self):
-        """Get input field styling"""
-        return """
-            QLineEdit, QSpinBox {
-                background-color: #F9FAFB;
-                border: 2px solid #E5E7EB;
-                border-radius: 6px;
-                padding: 8px 12px;
-                color: #1F2937;
-                font-size: 12px;
-            }
-            QLineEdit:focus, QSpinBox:focus {
-                border-color: #3B82F6;
-                background-color: #FFFFFF;
-            }
-        """
+    def create_spin_box(self, key: str, minimum: int, maximum: int, default: int,
+                        suffix: str = "") -> QSpinBox:
+        """Create a spin box that edits a temporary setting"""
+        spin = QSpinBox()
+        spin.setRange(minimum, maximum)
+        spin.setValue(self.temp_settings.get(key, default))
+        if suffix:
+            spin.setSuffix(suffix)
+        spin.valueChanged.connect(partial(self.update_temp_setting, key))
+        self.input_fields[key] = spin
+        return spin
         
     def create_color_button(self, setting_key, tooltip):
         """Create a color picker button"""
         btn = QPushButton()
         btn.setFixedSize(120, 36)
         btn.setToolTip(tooltip)
-        color = self.temp_settings[setting_key]
-        btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {color};
-                border: 2px solid #E5E7EB;
-                border-radius: 6px;
-            }}
-            QPushButton:hover {{
-                border: 2px solid #3B82F6;
-            }}
-        """)
+        self.set_button_color(btn, self.temp_settings[setting_key])
         btn.clicked.connect(lambda: self.pick_color(setting_key, btn))
         return btn
         
+    @classmethod
+    def _color_button_style(cls, color_hex: str) -> str:
+        """Get the stylesheet of a color swatch button (built once per color)"""
+        style = cls._COLOR_BTN_SS_CACHE.get(color_hex)
+        if style is None:
+            style = cls._COLOR_BTN_SS_CACHE[color_hex] = _SWATCH_QSS.format(color=color_hex)
+        return style
+        
+    def set_button_color(self, button: QPushButton, color_hex: str):
+        """Show a color on a swatch button, restyling it only if the color changed"""
+        if button.property('_color') == color_hex:
+            return
+        button.setProperty('_color', color_hex)
+        button.setStyleSheet(self._color_button_style(color_hex))
+        
     def pick_color(self, setting_key, button):
         """Open color picker dialog"""
-        current_color = QColor(self.temp_settings[setting_key])
+        from PySide6.QtWidgets import QColorDialog
+        # Reuse the swatch's QColor while its setting still holds that color
+        current_hex = self.temp_settings[setting_key]
+        current_color = self._qcolor_cache.get(setting_key)
+        if current_color is None or current_color.name() != current_hex.lower():
+            current_color = self._qcolor_cache[setting_key] = QColor(current_hex)
         color = QColorDialog.getColor(current_color, self, f"Choose {setting_key}")
         
         if color.isValid():
+            self._qcolor_cache[setting_key] = color
             color_hex = color.name()
-            self.temp_settings[setting_key] = color_hex
-            button.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {color_hex};
-                    border: 2px solid #E5E7EB;
-                    border-radius: 6px;
-                }}
-                QPushButton:hover {{
-                    border: 2px solid #3B82F6;
-                }}
-            """)
+            self.update_temp_setting(setting_key, color_hex)
+            self.set_button_color(button, color_hex)
             
     def update_temp_setting(self, key, value):
         """Update a temporary setting value (not applied yet)"""
         self.temp_settings[key] = value
+        self._dirty = True
+        
+    def _queue_update(self, key, value):
+        """Hold a typed value until the debounce timer runs out"""
+        self._pending[key] = value
+        self._debounce.start()
+        
+    def _flush_pending(self):
+        """Store any held typed values as temporary settings"""
+        self._debounce.stop()
+        for key, value in self._pending.items():
+            self.update_temp_setting(key, value)
+        self._pending.clear()
+        
+    def _show_toast(self, message: str):
+        """Briefly show a non-blocking confirmation message"""
+        self._toast.setText(message)
+        self._toast.adjustSize()
+        
+        # Centered just above the action buttons
+        x = (self.width() - self._toast.width()) // 2
+        y = self._button_bar.y() - self._toast.height() - 12
+        self._toast.move(x, y)
+        self._toast.raise_()
+        self._toast.show()
+        self._toast_timer.start()
         
     def apply_changes(self):
         """Apply all pending changes"""
+        from PySide6.QtWidgets import QMessageBox
+        # Include text typed just before clicking Apply
+        self._flush_pending()
+        
+        # Only the settings that differ from the applied ones need saving
+        changed = {key: value for key, value in self.temp_settings.items()
+                   if self.settings.get(key) != value}
+        if not changed:
+            self._show_toast("There are no changes to apply.")
+            return
+            
         # Use controller if available
         if self.settings_controller:
-            success, message = self.settings_controller.apply_settings(self.temp_settings)
+            success, message = self.settings_controller.apply_settings(changed)
             if success:
                 self.settings = self.settings_controller.settings
-                QMessageBox.information(self, "✓ Success", message)
+                self._dirty = False
+                self._show_toast(f"✓ {message}")
             else:
                 QMessageBox.critical(self, "❌ Error", message)
         else:
             # Fallback: local settings
             self.settings = self.temp_settings.copy()
+            self._dirty = False
             self.settings_changed.emit(self.settings)
-            QMessageBox.information(
-                self,
-                "✓ Settings Applied",
-                "All settings have been applied successfully!"
-            )
+            self._show_toast("✓ All settings have been applied successfully!")
         
     def cancel_changes(self):
         """Cancel all pending changes"""
-        self.temp_settings = self.settings.copy()
+        self._debounce.stop()
+        self._pending.clear()
+        
+        # Nothing to revert unless a setting was edited since the last apply
+        if self._dirty:
+            # Refill the same dict rather than replacing it
+            self.temp_settings.clear()
+            self.temp_settings.update(self.settings)
+            
+            # Reset all color buttons
+            for key, button in self.color_buttons.items():
+                self.set_button_color(button, self.settings[key])
+            self._dirty = False
         
-        # Reset all color buttons
-        for key, button in self.color_buttons.items():
-            color = self.settings[key]
-            button.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {color};
-                    border: 2px solid #E5E7EB;
-                    border-radius: 6px;
-                }}
-                QPushButton:hover {{
-                    border: 2px solid #3B82F6;
-                }}
-            """)
-        
-        QMessageBox.information(
-            self,
-            "Changes Cancelled",
-            "All changes have been discarded."
-        )
+        self._show_toast("All changes have been discarded.")
         
     def reset_to_defaults(self):
         """Reset all settings to default values"""
+        from PySide6.QtWidgets import QMessageBox
         reply = QMessageBox.question(
             self,
             "Reset to Defaults",
@@ -414,6 +505,9 @@ class SettingsView(QWidget):
         )
         
         if reply == QMessageBox.Yes:
+            self._debounce.stop()
+            self._pending.clear()
+            
             # Reset to defaults using controller if available
             if self.settings_controller:
                 defaults = self.settings_controller.reset_to_defaults()
@@ -431,41 +525,29 @@ class SettingsView(QWidget):
                     'tcp_bind_address': '0.0.0.0',
                 }
                 self.temp_settings = self.settings.copy()
+            self._dirty = False
             
-            # Update all UI fields with reset values from settings
-            # Update spinboxes
-            if 'grid_size' in self.input_fields and 'grid_size' in self.settings:
-                self.input_fields['grid_size'].setValue(self.settings['grid_size'])
-            if 'snap_distance' in self.input_fields and 'snap_distance' in self.settings:
-                self.input_fields['snap_distance'].setValue(self.settings['snap_distance'])
-            if 'tcp_port' in self.input_fields and 'tcp_port' in self.settings:
-                self.input_fields['tcp_port'].setValue(self.settings['tcp_port'])
-            
-            # Update line edits
-            if 'tcp_bind_address' in self.input_fields and 'tcp_bind_address' in self.settings:
-                self.input_fields['tcp_bind_address'].setText(self.settings['tcp_bind_address'])
+            # Update all UI fields with reset values from settings; temp_settings
+            # already holds them, so the fields' change signals stay quiet
+            with _signals_blocked(self.input_fields.values()):
+                for key in self._SPIN_KEYS:
+                    field = self.input_fields.get(key)
+                    value = self.settings.get(key)
+                    if field is not None and value is not None:
+                        field.setValue(value)
+                for key in self._TEXT_KEYS:
+                    field = self.input_fields.get(key)
+                    value = self.settings.get(key)
+                    if field is not None and value is not None:
+                        field.setText(value)
             
             # Update color buttons with reset values
             for key, button in self.color_buttons.items():
                 if key in self.settings:
-                    color = self.settings[key]
-                    button.setStyleSheet(f"""
-                        QPushButton {{
-                            background-color: {color};
-                            border: 2px solid #E5E7EB;
-                            border-radius: 6px;
-                        }}
-                        QPushButton:hover {{
-                            border: 2px solid #3B82F6;
-                        }}
-                    """)
+                    self.set_button_color(button, self.settings[key])
             
             # Only emit if not using controller (controller already emits)
             if not self.settings_controller:
                 self.settings_changed.emit(self.settings)
             
-            QMessageBox.information(
-                self,
-                "Settings Reset",
-                "All settings have been reset to default values!"
-            )
+            self._show_toast("All settings have been reset to default values!")
@@ -14,7 +14,24 @@ from .theme import (
     get_combo_box_style,
     get_card_style,
     get_label_style,
+    REFRESH_BUTTON_STYLE,
+    DELETE_BUTTON_STYLE,
+    OPEN_BUTTON_STYLE,
+    CHANGE_DIR_BUTTON_STYLE,
+    DIR_CONTAINER_STYLE,
+    SPIN_BOX_STYLE,
+    GRAPHICS_VIEW_STYLE,
 )
+from .fonts import (
+    FONT_TITLE,
+    FONT_SECTION,
+    FONT_BODY,
+    FONT_NAV,
+    FONT_SIDEBAR_TITLE,
+    FONT_PAGE_HEADER,
+    FONT_CARD_TITLE,
+)
+from .icons import emoji_pixmap
 
 __all__ = [
     'COLORS',
@@ -31,5 +48,20 @@ __all__ = [
     'get_combo_box_style',
     'get_card_style',
     'get_label_style',
+    'REFRESH_BUTTON_STYLE',
+    'DELETE_BUTTON_STYLE',
+    'OPEN_BUTTON_STYLE',
+    'CHANGE_DIR_BUTTON_STYLE',
+    'DIR_CONTAINER_STYLE',
+    'SPIN_BOX_STYLE',
+    'GRAPHICS_VIEW_STYLE',
+    'FONT_TITLE',
+    'FONT_SECTION',
+    'FONT_BODY',
+    'FONT_NAV',
+    'FONT_SIDEBAR_TITLE',
+    'FONT_PAGE_HEADER',
+    'FONT_CARD_TITLE',
+    'emoji_pixmap',
 ]
 
@@ -0,0 +1,13 @@
+"""
+Shared QFont instances
+QFont is implicitly shared, so widgets can reuse these without copying
+"""
+from PySide6.QtGui import QFont
+
+FONT_TITLE = QFont("Arial", 28, QFont.Bold)
+FONT_SECTION = QFont("Arial", 16, QFont.Bold)
+FONT_BODY = QFont("Arial", 12)
+FONT_NAV = QFont("Arial", 14)
+FONT_SIDEBAR_TITLE = QFont("Arial", 14, QFont.Bold)
+FONT_PAGE_HEADER = QFont("Arial", 24, QFont.Bold)
+FONT_CARD_TITLE = QFont("Arial", 15, QFont.Bold)
@@ -0,0 +1,31 @@
+"""
+Emoji icons pre-rendered to pixmaps
+Each (emoji, size) pair is rendered once and reused, so repaints don't go
+through the emoji font shaping path
+"""
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QFont, QGuiApplication, QPainter, QPixmap
+
+_ICON_CACHE = {}
+
+
+def emoji_pixmap(char: str, px: int) -> QPixmap:
+    """Return a cached transparent pixmap of an emoji, px logical pixels square"""
+    key = (char, px)
+    pixmap = _ICON_CACHE.get(key)
+    if pixmap is None:
+        screen = QGuiApplication.primaryScreen()
+        ratio = screen.devicePixelRatio() if screen else 1.0
+        pixmap = QPixmap(int(px * ratio), int(px * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        
+        font = QFont("Arial")
+        font.setPixelSize(int(px * 0.8))
+        painter = QPainter(pixmap)
+        painter.setFont(font)
+        painter.drawText(0, 0, px, px, Qt.AlignCenter, char)
+        painter.end()
+        
+        _ICON_CACHE[key] = pixmap
+    return pixmap
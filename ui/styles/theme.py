@@ -2,8 +2,12 @@
 UI Theme and Styling Constants
 Centralized styling for consistent UI appearance
 """
+from functools import lru_cache
+from dataclasses import make_dataclass
+
 
 # Color Palette
+# The get_*_style functions below cache their result, so treat these tables as read-only
 COLORS = {
     # Primary colors
     'primary': '#48BB78',
@@ -76,20 +80,18 @@ RADIUS = {
 }
 
 
-def get_button_style(
-    bg_color: str,
-    hover_color: str,
-    pressed_color: str,
-    text_color: str = 'white',
-    padding: str = '10px 20px',
-    border_radius: str = None,
-    font_size: str = None
-) -> str:
-    """Generate button stylesheet"""
-    border_radius = border_radius or RADIUS['lg']
-    font_size = font_size or FONT_SIZES['normal']
-    
-    return f"""
+def _frozen_view(name: str, table: dict):
+    """Frozen, slotted dataclass instance with one attribute per table entry"""
+    return make_dataclass(name, list(table), frozen=True, slots=True)(**table)
+
+
+# Attribute views of the tables above for the style builders; the dicts stay the public API
+_COLORS_NS = _frozen_view('_Colors', COLORS)
+_FONT_SIZES_NS = _frozen_view('_FontSizes', FONT_SIZES)
+_RADIUS_NS = _frozen_view('_Radius', RADIUS)
+
+# Button stylesheet template, filled in by get_button_style
+_BUTTON_QSS = """
         QPushButton {{
             background-color: {bg_color};
             color: {text_color};
@@ -106,111 +108,145 @@ def get_button_style(
             background-color: {pressed_color};
         }}
         QPushButton:disabled {{
-            background-color: {COLORS['border']};
-            color: {COLORS['text_light']};
+            background-color: {disabled_bg};
+            color: {disabled_text};
         }}
     """
 
 
+@lru_cache(maxsize=64)
+def get_button_style(
+    bg_color: str,
+    hover_color: str,
+    pressed_color: str,
+    text_color: str = 'white',
+    padding: str = '10px 20px',
+    border_radius: str = None,
+    font_size: str = None
+) -> str:
+    """Generate button stylesheet"""
+    border_radius = border_radius or _RADIUS_NS.lg
+    font_size = font_size or _FONT_SIZES_NS.normal
+    
+    return _BUTTON_QSS.format(
+        bg_color=bg_color,
+        hover_color=hover_color,
+        pressed_color=pressed_color,
+        text_color=text_color,
+        padding=padding,
+        border_radius=border_radius,
+        font_size=font_size,
+        disabled_bg=_COLORS_NS.border,
+        disabled_text=_COLORS_NS.text_light,
+    )
+
+
+@lru_cache(maxsize=None)
 def get_primary_button_style() -> str:
     """Get primary button style"""
     return get_button_style(
-        COLORS['primary'],
-        COLORS['primary_hover'],
-        COLORS['primary_pressed']
+        _COLORS_NS.primary,
+        _COLORS_NS.primary_hover,
+        _COLORS_NS.primary_pressed
     )
 
 
+@lru_cache(maxsize=None)
 def get_secondary_button_style() -> str:
     """Get secondary button style"""
     return get_button_style(
-        COLORS['secondary'],
-        COLORS['secondary_hover'],
-        COLORS['secondary_pressed']
+        _COLORS_NS.secondary,
+        _COLORS_NS.secondary_hover,
+        _COLORS_NS.secondary_pressed
     )
 
 
+@lru_cache(maxsize=None)
 def get_accent_button_style() -> str:
     """Get accent button style"""
     return get_button_style(
-        COLORS['accent'],
-        COLORS['accent_hover'],
-        COLORS['accent_pressed']
+        _COLORS_NS.accent,
+        _COLORS_NS.accent_hover,
+        _COLORS_NS.accent_pressed
     )
 
 
+@lru_cache(maxsize=None)
 def get_danger_button_style() -> str:
     """Get danger button style"""
     return get_button_style(
-        COLORS['danger'],
-        COLORS['danger_hover'],
-        COLORS['danger_pressed']
+        _COLORS_NS.danger,
+        _COLORS_NS.danger_hover,
+        _COLORS_NS.danger_pressed
     )
 
 
+@lru_cache(maxsize=None)
 def get_toggle_button_style() -> str:
     """Get toggle button style (for checkable buttons)"""
     return f"""
         QPushButton {{
-            background-color: {COLORS['background']};
-            color: {COLORS['text_secondary']};
-            border: 2px solid {COLORS['border']};
-            border-radius: {RADIUS['lg']};
+            background-color: {_COLORS_NS.background};
+            color: {_COLORS_NS.text_secondary};
+            border: 2px solid {_COLORS_NS.border};
+            border-radius: {_RADIUS_NS.lg};
             padding: 10px 18px;
             font-weight: 600;
-            font-size: {FONT_SIZES['normal']};
+            font-size: {_FONT_SIZES_NS.normal};
         }}
         QPushButton:hover {{
-            background-color: {COLORS['background_dark']};
-            border-color: {COLORS['border_hover']};
+            background-color: {_COLORS_NS.background_dark};
+            border-color: {_COLORS_NS.border_hover};
         }}
         QPushButton:pressed {{
-            background-color: {COLORS['border']};
+            background-color: {_COLORS_NS.border};
         }}
         QPushButton:checked {{
-            background-color: {COLORS['secondary']};
+            background-color: {_COLORS_NS.secondary};
             color: white;
-            border-color: {COLORS['secondary']};
+            border-color: {_COLORS_NS.secondary};
         }}
     """
 
 
+@lru_cache(maxsize=None)
 def get_input_style() -> str:
     """Get input field style (QLineEdit, QSpinBox, etc.)"""
     return f"""
         QSpinBox, QLineEdit, QComboBox {{
-            background-color: {COLORS['background']};
-            border: 2px solid {COLORS['border']};
-            border-radius: {RADIUS['md']};
+            background-color: {_COLORS_NS.background};
+            border: 2px solid {_COLORS_NS.border};
+            border-radius: {_RADIUS_NS.md};
             padding: 6px 10px;
-            color: {COLORS['text_secondary']};
-            font-size: {FONT_SIZES['normal']};
+            color: {_COLORS_NS.text_secondary};
+            font-size: {_FONT_SIZES_NS.normal};
         }}
         QSpinBox:hover, QLineEdit:hover, QComboBox:hover {{
-            border-color: {COLORS['border_hover']};
-            background-color: {COLORS['background_dark']};
+            border-color: {_COLORS_NS.border_hover};
+            background-color: {_COLORS_NS.background_dark};
         }}
         QSpinBox:focus, QLineEdit:focus, QComboBox:focus {{
-            border-color: {COLORS['secondary']};
+            border-color: {_COLORS_NS.secondary};
         }}
     """
 
 
+@lru_cache(maxsize=None)
 def get_combo_box_style() -> str:
     """Get combo box style"""
     return f"""
         QComboBox {{
-            background-color: {COLORS['background']};
-            border: 2px solid {COLORS['border']};
-            border-radius: {RADIUS['lg']};
+            background-color: {_COLORS_NS.background};
+            border: 2px solid {_COLORS_NS.border};
+            border-radius: {_RADIUS_NS.lg};
             padding: 8px 12px;
-            color: {COLORS['text_secondary']};
-            font-size: {FONT_SIZES['normal']};
+            color: {_COLORS_NS.text_secondary};
+            font-size: {_FONT_SIZES_NS.normal};
             min-width: 130px;
         }}
         QComboBox:hover {{
-            border-color: {COLORS['border_hover']};
-            background-color: {COLORS['background_dark']};
+            border-color: {_COLORS_NS.border_hover};
+            background-color: {_COLORS_NS.background_dark};
         }}
         QComboBox::drop-down {{
             border: none;
@@ -219,32 +255,137 @@ def get_combo_box_style() -> str:
     """
 
 
+@lru_cache(maxsize=None)
 def get_card_style() -> str:
     """Get card container style"""
     return f"""
         QGroupBox {{
-            background-color: {COLORS['surface']};
-            border: 1px solid {COLORS['border']};
-            border-radius: {RADIUS['xl']};
+            background-color: {_COLORS_NS.surface};
+            border: 1px solid {_COLORS_NS.border};
+            border-radius: {_RADIUS_NS.xl};
             padding: 16px;
             margin-top: 10px;
             font-weight: 600;
-            color: {COLORS['text_primary']};
+            color: {_COLORS_NS.text_primary};
         }}
         QGroupBox::title {{
             subcontrol-origin: margin;
             subcontrol-position: top left;
             padding: 0 8px;
-            color: {COLORS['text_primary']};
+            color: {_COLORS_NS.text_primary};
         }}
     """
 
 
+@lru_cache(maxsize=64)
 def get_label_style(color: str = None, size: str = 'normal', weight: str = 'normal') -> str:
     """Get label style"""
-    color = color or COLORS['text_secondary']
-    font_size = FONT_SIZES.get(size, FONT_SIZES['normal'])
+    color = color or _COLORS_NS.text_secondary
+    font_size = FONT_SIZES.get(size, _FONT_SIZES_NS.normal)
     font_weight = '600' if weight == 'bold' else 'normal'
     
     return f"color: {color}; font-weight: {font_weight}; font-size: {font_size};"
 
+
+
+# Precomputed widget stylesheets
+# Built once at import so views reuse the same string on every construction
+
+REFRESH_BUTTON_STYLE = """
+    QPushButton {
+        background-color: #F3F4F6;
+        color: #374151;
+        border: 2px solid #E5E7EB;
+        padding: 10px 20px;
+        font-size: 13px;
+        font-weight: 600;
+        border-radius: 8px;
+    }
+    QPushButton:hover {
+        background-color: #E5E7EB;
+        border-color: #D1D5DB;
+    }
+"""
+
+DELETE_BUTTON_STYLE = """
+    QPushButton {
+        background-color: #FEF2F2;
+        color: #DC2626;
+        border: 2px solid #FCA5A5;
+        padding: 10px 20px;
+        font-size: 13px;
+        font-weight: 600;
+        border-radius: 8px;
+    }
+    QPushButton:hover {
+        background-color: #FEE2E2;
+        border-color: #F87171;
+    }
+"""
+
+OPEN_BUTTON_STYLE = """
+    QPushButton {
+        background-color: #10B981;
+        color: white;
+        border: none;
+        padding: 10px 24px;
+        font-size: 13px;
+        font-weight: 600;
+        border-radius: 8px;
+    }
+    QPushButton:hover {
+        background-color: #059669;
+    }
+    QPushButton:pressed {
+        background-color: #047857;
+    }
+"""
+
+CHANGE_DIR_BUTTON_STYLE = """
+    QPushButton {
+        background-color: #FFFFFF;
+        color: #374151;
+        border: 2px solid #D1D5DB;
+        padding: 6px 16px;
+        font-size: 11px;
+        font-weight: 600;
+        border-radius: 6px;
+    }
+    QPushButton:hover {
+        background-color: #F3F4F6;
+        border-color: #9CA3AF;
+    }
+"""
+
+DIR_CONTAINER_STYLE = """
+    QFrame {
+        background-color: #F9FAFB;
+        border: 2px solid #E5E7EB;
+        border-radius: 8px;
+        padding: 12px;
+    }
+"""
+
+SPIN_BOX_STYLE = f"""
+    QSpinBox {{
+        background-color: {_COLORS_NS.background};
+        border: 2px solid {_COLORS_NS.border};
+        border-radius: {_RADIUS_NS.lg};
+        padding: 8px 12px;
+        color: {_COLORS_NS.text_secondary};
+        font-size: {_FONT_SIZES_NS.normal};
+        min-width: 90px;
+    }}
+    QSpinBox:hover {{
+        border-color: {_COLORS_NS.border_hover};
+        background-color: {_COLORS_NS.background_dark};
+    }}
+"""
+
+GRAPHICS_VIEW_STYLE = f"""
+    QGraphicsView {{
+        border: none;
+        border-radius: {_RADIUS_NS.xl};
+        background-color: {_COLORS_NS.grid_bg};
+    }}
+"""